@@ -4,7 +4,7 @@
 from .builder import UIBuilder
 
 # 导出基础组件
-from .components import VersionCardWidget, ToggleSwitch
+from .components import VersionCardWidget, ToggleSwitch, LazyComboBox
 
 # 导出下载线程
 from .download_thread import DownloadThread
@@ -16,6 +16,7 @@ __all__ = [
     'UIBuilder',
     'VersionCardWidget',
     'ToggleSwitch',
+    'LazyComboBox',
     'DownloadThread',
     'StyleMixin',
 ]
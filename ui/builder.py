@@ -16,7 +16,7 @@ from styles import SLIDER_STYLE, STYLE_BTN, STYLE_ICON
 from utils import load_svg_icon, scale_icon_for_display
 from widgets import (CardButton, ClickableLabel, JellyButton,
                       get_current_font, make_transparent, set_current_font,
-                      TextRenderer, ModrinthResultCard)
+                      TextRenderer)
 
 # 导入重构后的模块
 from .components import VersionCardWidget, ToggleSwitch
@@ -39,6 +39,8 @@ class UIBuilder(StyleMixin):
     def __init__(self, window):
         self.window = window
         self.dpi_scale = getattr(window, 'dpi_scale', 1.0)
+        # 已缩放的尺寸：原始尺寸 -> 缩放后尺寸（DPI 在构建器生命周期内不变）
+        self._scaled_sizes = {}
         # 获取 window 的 text_renderer，如果没有则创建一个新的
         self.text_renderer = getattr(window, 'text_renderer', None)
         if self.text_renderer is None:
@@ -52,8 +54,12 @@ class UIBuilder(StyleMixin):
         self.downloads_page_builder = DownloadsPageBuilder(self)
 
     def _scale_size(self, size):
-        """缩放尺寸"""
-        return int(size * self.dpi_scale)
+        """缩放尺寸（结果按原始尺寸缓存）"""
+        try:
+            return self._scaled_sizes[size]
+        except KeyError:
+            scaled = self._scaled_sizes[size] = int(size * self.dpi_scale)
+            return scaled
 
     def _get_font_family(self):
         """获取当前字体系列"""
@@ -276,7 +282,7 @@ class UIBuilder(StyleMixin):
 
     def _update_instance_version_labels(self):
         """更新实例页面中版本列表的标签（包括根版本名称）"""
-        if not hasattr(self.window, 'instance_version_list_container'):
+        if self.window.instance_version_list_container is None:
             return
 
         root_text = self.window.language_manager.translate("instance_version_root")
@@ -315,8 +321,7 @@ class UIBuilder(StyleMixin):
 
     def _update_settings_font(self, font_family):
         """更新设置页面的字体"""
-        # 这个方法需要从 settings_page_builder 中实现
-        pass
+        self.settings_page_builder.update_font()
 
     def _refresh_instance_page(self):
         """刷新实例页面（当版本隔离设置变化时调用）"""
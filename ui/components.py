@@ -6,7 +6,7 @@
 import logging
 from PyQt6.QtCore import (Qt, QPropertyAnimation, QEasingCurve, pyqtSignal)
 from PyQt6.QtGui import QPainter, QColor, QBrush
-from PyQt6.QtWidgets import QWidget
+from PyQt6.QtWidgets import QWidget, QComboBox
 
 from utils import load_svg_icon, scale_icon_for_display
 
@@ -164,3 +164,48 @@ class ToggleSwitch(QWidget):
         else:
             painter.setBrush(QBrush(QColor(200, 200, 200)))
         painter.drawEllipse(int(knob_x), int(knob_y), int(knob_size), int(knob_size))
+
+
+class LazyComboBox(QComboBox):
+    """延迟填充选项的下拉框
+
+    初始只放入当前选项，首次展开列表或用滚轮、键盘切换选项时才加入全部选项
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending_items = None
+
+    def setLazyItems(self, items, current_text):
+        """设置全部选项和当前选项（current_text 不在 items 中时显示第一项）"""
+        self.clear()
+        self._pending_items = None
+        if not items:
+            return
+        self.addItem(current_text if current_text in items else items[0])
+        self._pending_items = items
+
+    def _populate_items(self):
+        """加入全部选项并保持当前选项不变（不触发选项变化信号）"""
+        items = self._pending_items
+        if items is None:
+            return
+        self._pending_items = None
+        current_text = self.currentText()
+        blocked = self.blockSignals(True)
+        self.clear()
+        self.addItems(items)
+        self.setCurrentIndex(self.findText(current_text))
+        self.blockSignals(blocked)
+
+    def showPopup(self):
+        self._populate_items()
+        super().showPopup()
+
+    def wheelEvent(self, event):
+        self._populate_items()
+        super().wheelEvent(event)
+
+    def keyPressEvent(self, event):
+        self._populate_items()
+        super().keyPressEvent(event)
@@ -19,6 +19,8 @@ class DownloadsPageBuilder:
 
     def __init__(self, builder):
         self.builder = builder
+        # 是否有搜索请求正在进行，用于防止翻页时重复请求
+        self._search_in_flight = False
 
     def create_download_page(self):
         """创建下载页面"""
@@ -400,6 +402,7 @@ class DownloadsPageBuilder:
 
         self.builder.window.download_last_query = query
         self.builder.window.download_current_page = page
+        self._search_in_flight = True
 
         self._clear_search_results()
         self._show_loading_message()
@@ -420,7 +423,8 @@ class DownloadsPageBuilder:
                 QTimer.singleShot(0, lambda: self._on_modrinth_search_finished(hits, total_hits))
             except Exception as e:
                 logger.error(f"Modrinth search failed: {e}")
-                QTimer.singleShot(0, lambda: self._on_search_error(str(e)))
+                error_message = str(e)
+                QTimer.singleShot(0, lambda: self._on_search_error(error_message))
 
         QTimer.singleShot(50, do_search)
 
@@ -460,6 +464,7 @@ class DownloadsPageBuilder:
 
     def _on_modrinth_search_finished(self, hits, total_hits):
         """Modrinth 搜索完成"""
+        self._search_in_flight = False
         self._clear_search_results()
 
         if not hits:
@@ -533,6 +538,7 @@ class DownloadsPageBuilder:
 
     def _on_search_error(self, error):
         """搜索错误处理"""
+        self._search_in_flight = False
         self._clear_search_results()
         self._show_error_message(error)
         logger.error(f"Search error: {error}")
@@ -712,6 +718,8 @@ class DownloadsPageBuilder:
 
     def _on_prev_page(self):
         """上一页"""
+        if self._search_in_flight:
+            return
         if self.builder.window.download_current_page > 1:
             self._search_modrinth(
                 self.builder.window.download_last_query,
@@ -720,6 +728,8 @@ class DownloadsPageBuilder:
 
     def _on_next_page(self):
         """下一页"""
+        if self._search_in_flight:
+            return
         if self.builder.window.download_current_page < self.builder.window.download_total_pages:
             self._search_modrinth(
                 self.builder.window.download_last_query,
@@ -752,37 +762,41 @@ class DownloadsPageBuilder:
 
             # 如果版本隔离关闭，直接返回根目录的resourcepacks路径
             if not self.builder.window.config.get("version_isolation", True):
-                root_resourcepacks_path = os.path.join(minecraft_path, "resourcepacks")
-                logger.info(f"Version isolation OFF, target path: {normalize_path(root_resourcepacks_path)}")
-                return root_resourcepacks_path
+                target_path = os.path.join(minecraft_path, "resourcepacks")
+                self._log_target_path("Version isolation OFF, target path: %s", target_path)
+                return target_path
 
             # 版本隔离开启时，根据下拉框选择返回对应路径
             selected_version = self.builder.window.download_version_combo.currentText()
-            logger.info(f"Version isolation ON, selected version: {selected_version}")
+            logger.info("Version isolation ON, selected version: %s", selected_version)
 
             if selected_version:
                 root_text = self.builder.window.language_manager.translate("instance_version_root")
                 if selected_version == root_text:
-                    root_resourcepacks_path = os.path.join(minecraft_path, "resourcepacks")
-                    logger.info(f"Root directory selected, target path: {normalize_path(root_resourcepacks_path)}")
-                    return root_resourcepacks_path
+                    target_path = os.path.join(minecraft_path, "resourcepacks")
+                    self._log_target_path("Root directory selected, target path: %s", target_path)
                 else:
-                    version_resourcepacks_path = os.path.join(minecraft_path, "versions", selected_version, "resourcepacks")
-                    logger.info(f"Version selected, target path: {normalize_path(version_resourcepacks_path)}")
-                    return version_resourcepacks_path
+                    target_path = os.path.join(minecraft_path, "versions", selected_version, "resourcepacks")
+                    self._log_target_path("Version selected, target path: %s", target_path)
+                return target_path
 
-            root_resourcepacks_path = os.path.join(minecraft_path, "resourcepacks")
-            logger.info(f"No version selected, default to root, target path: {normalize_path(root_resourcepacks_path)}")
-            return root_resourcepacks_path
+            target_path = os.path.join(minecraft_path, "resourcepacks")
+            self._log_target_path("No version selected, default to root, target path: %s", target_path)
+            return target_path
         except Exception as e:
             logger.error(f"Error getting download target path: {e}")
             import traceback
             logger.error(traceback.format_exc())
             return None
 
+    @staticmethod
+    def _log_target_path(message, target_path):
+        """记录目标路径（仅在 INFO 级别启用时才规范化路径）"""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(message, normalize_path(target_path))
+
     def _load_versions_to_download_combo(self):
         """从.minecraft路径加载版本列表到下载页面的下拉框"""
-        import os
         try:
             if not self.builder.window.config.get("version_isolation", True):
                 self.builder.window.download_version_combo.clear()
@@ -793,11 +807,8 @@ class DownloadsPageBuilder:
                 versions_path = os.path.join(minecraft_path, "versions")
                 if os.path.exists(versions_path) and os.path.isdir(versions_path):
                     self.builder.window.download_version_combo.clear()
-                    versions = []
-                    for item in sorted(os.listdir(versions_path)):
-                        item_path = os.path.join(versions_path, item)
-                        if os.path.isdir(item_path):
-                            versions.append(item)
+                    with os.scandir(versions_path) as entries:
+                        versions = sorted(entry.name for entry in entries if entry.is_dir())
 
                     for version in versions:
                         self.builder.window.download_version_combo.addItem(version)
@@ -5,28 +5,217 @@
 
 import os
 import sys
+import stat
 import logging
+import re
 import json
-import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QDialog,
+from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QDialog,
                              QPushButton, QFileDialog, QCheckBox, QComboBox)
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtGui import QPixmap, QIcon
 
 from utils import load_svg_icon, scale_icon_for_display, normalize_path
-from widgets import ClickableLabel, FileExplorer
+from widgets import ClickableLabel
 
 logger = logging.getLogger(__name__)
 
 
+# PNG 资源根目录（支持开发环境和打包后环境），导入时解析一次
+if hasattr(sys, '_MEIPASS'):
+    _PNG_ROOT = sys._MEIPASS if os.path.isdir(os.path.join(sys._MEIPASS, "png")) else os.getcwd()
+else:
+    _PNG_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# 页面和对话框构建中用到的缩放尺寸，DPI 缩放在构建器创建后不再变化，统一预先计算
+_SCALED_SIZES = (4, 6, 8, 10, 12, 13, 14, 15, 16, 20, 24, 32, 36, 48, 100, 180, 400)
+
+# 样式表模板，按当前字体和DPI格式化一次后复用
+_TITLE_QSS = "color:white;font-size:{size}px;font-family:'{font}';font-weight:bold;"
+_SECTION_TITLE_QSS = "color:white;font-size:{size}px;font-weight:bold;font-family:'{font}';background:transparent;"
+_DESC_QSS = "color:rgba(255,255,255,0.6);font-size:{size}px;font-family:'{font}';background:transparent;"
+_NAME_QSS = "color:white;font-size:{size}px;font-family:'{font}';background:transparent;"
+_CONTAINER_QSS = "background:rgba(255,255,255,0.08);border-radius:{radius}px;"
+_CARD_NORMAL_QSS = """
+            QWidget {{
+                background: rgba(255, 255, 255, 0.08);
+                border-radius: {radius}px;
+            }}
+        """
+_CARD_HOVER_QSS = """
+            QWidget {{
+                background: rgba(255, 255, 255, 0.15);
+                border-radius: {radius}px;
+            }}
+        """
+_BTN_QSS = """
+                QPushButton {
+                    background: transparent;
+                    border: none;
+                    padding: 0;
+                }
+                QPushButton:hover {
+                    background: rgba(255, 255, 255, 0.1);
+                    border-radius: 4px;
+                }
+            """
+
+# 重命名对话框样式表模板
+_DIALOG_QSS = """
+                QDialog {{
+                    background: {background};
+                    border: 1px solid rgba(255, 255, 255, 0.3);
+                    border-radius: {radius}px;
+                }}
+            """
+_DIALOG_TITLE_QSS = """
+            QLabel {{
+                color: rgba(255, 255, 255, 0.9);
+                background: transparent;
+                font-size: {size}px;
+                font-family: '{font}';
+            }}
+        """
+_DIALOG_INPUT_QSS = """
+            QLineEdit {{
+                background: rgba(255, 255, 255, 0.1);
+                border: 1px solid rgba(255, 255, 255, 0.2);
+                border-radius: {radius}px;
+                padding: 0 {padding}px;
+                color: rgba(255, 255, 255, 0.9);
+                font-size: {size}px;
+                font-family: '{font}';
+            }}
+            QLineEdit:focus {{
+                background: rgba(255, 255, 255, 0.15);
+                border: 1px solid rgba(100, 150, 255, 0.6);
+            }}
+        """
+_DIALOG_CANCEL_QSS = """
+            QPushButton {{
+                background: rgba(255, 255, 255, 0.08);
+                border: 1px solid rgba(255, 255, 255, 0.15);
+                border-radius: {radius}px;
+                color: rgba(255, 255, 255, 0.9);
+                font-size: {size}px;
+                font-family: '{font}';
+                padding: 0;
+            }}
+            QPushButton:hover {{
+                background: rgba(255, 255, 255, 0.12);
+            }}
+            QPushButton:pressed {{
+                background: rgba(255, 255, 255, 0.08);
+            }}
+        """
+_DIALOG_CONFIRM_QSS = """
+            QPushButton {{
+                background: rgba(100, 150, 255, 0.8);
+                border: none;
+                border-radius: {radius}px;
+                color: white;
+                font-size: {size}px;
+                font-family: '{font}';
+                padding: 0;
+            }}
+            QPushButton:hover {{
+                background: rgba(100, 150, 255, 1.0);
+            }}
+            QPushButton:pressed {{
+                background: rgba(100, 150, 255, 0.7);
+            }}
+        """
+
+# 版本类型对应的图标，其他类型使用 png/block.png
+_VERSION_ICONS = {
+    "fabric": "png/fabric.png",
+    "forge": "png/forge.png",
+    "neoforge": "png/neoforged.png",
+}
+
+# 版本名称和版本 json 中的加载器标识（neoforge 写在 forge 前面，保证优先匹配）
+_LOADER_RE = re.compile(r"neoforge|forge|fabric", re.IGNORECASE)
+_NEOFORGE_RE = re.compile(r"neoforge", re.IGNORECASE)
+
+# 模组加载器在jar中的元数据文件位置
+_FABRIC_MOD_JSON = "fabric.mod.json"
+_MODS_TOML_ENTRIES = ("META-INF/mods.toml", "META-INF/neoforge.mods.toml")
+
+# 版本类型检测结果缓存的最大条目数
+_VERSION_TYPE_CACHE_SIZE = 512
+# 并行检测版本类型的最大线程数
+_VERSION_TYPE_WORKERS = 8
+
+
+def _loader_from_text(text):
+    """根据文本中的加载器标识返回版本类型（不区分大小写），没有标识时返回 None"""
+    match = _LOADER_RE.search(text)
+    return match.group(0).lower() if match else None
+
+
+class _VersionEntry:
+    """版本列表中的一个版本（收藏、别名等状态在交互时原地更新）"""
+
+    __slots__ = ("name", "path", "version_type", "favorited", "alias", "card", "bookmark_btn")
+
+    def __init__(self, name, path, version_type, favorited, alias):
+        self.name = name
+        self.path = path
+        self.version_type = version_type
+        self.favorited = favorited
+        self.alias = alias
+        self.card = None
+        self.bookmark_btn = None
+
+
 class InstancesPageBuilder:
     """实例页面构建器"""
 
+    # 图标缓存：(图标路径, 显示尺寸, DPI缩放) -> 已缩放的 QPixmap / QIcon
+    _ICON_CACHE = {}
+    _QICON_CACHE = {}
+
     def __init__(self, builder):
         self.builder = builder
+        # 预先缩放的常用尺寸
+        self._s = {n: builder._scale_size(n) for n in _SCALED_SIZES}
         # 配置编辑器页面缓存，用于返回
         self._config_editor_page = None
+        # 格式化后的样式表及其对应的字体
+        self._qss = {}
+        self._qss_font = None
+        # 版本类型检测缓存：(版本目录, 目录 mtime, json 的 mtime 和大小) -> 版本类型
+        self._version_type_cache = OrderedDict()
+        # 版本类型缓存对应的 Minecraft 路径，路径切换时清空缓存
+        self._version_type_cache_root = None
+        # 已创建的资源包页面：resourcepacks_path -> 页面
+        self._resourcepack_pages = {}
+        # 当前列表中的版本：version_name -> _VersionEntry（按名称排序插入）
+        self._catalog = {}
+        # 重命名对话框，首次使用时创建
+        self._edit_dialog = None
+        self._edit_dialog_font = None
+        # 路径输入防抖定时器，短时间内多次修改只重新加载一次
+        self._reload_timer = QTimer()
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.timeout.connect(self._reload_instance_path)
+        # 配置延迟保存定时器，退出程序前立即写入尚未保存的配置
+        self._config_save_pending = False
+        self._config_save_timer = QTimer()
+        self._config_save_timer.setSingleShot(True)
+        self._config_save_timer.timeout.connect(self._flush_config_save)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_config_save)
+        # 页面控件引用先置为 None，页面创建后再赋值，使用处只需判断是否为 None
+        window = builder.window
+        for attr in ('instance_version_container', 'instance_version_list_container',
+                     'instance_version_list_widget', 'root_resourcepacks_container',
+                     'root_resourcepacks_explorer', 'download_version_combo'):
+            if not hasattr(window, attr):
+                setattr(window, attr, None)
 
     def create_instance_page(self):
         """创建实例页面 - 使用多层级导航结构"""
@@ -56,22 +245,13 @@ class InstancesPageBuilder:
         page.setStyleSheet("background:transparent;")
         pl = QVBoxLayout(page)
         pl.setContentsMargins(
-            self.builder._scale_size(20), self.builder._scale_size(10),
-            self.builder._scale_size(20), self.builder._scale_size(20)
+            self._s[20], self._s[10],
+            self._s[20], self._s[20]
         )
-        pl.setSpacing(self.builder._scale_size(15))
+        pl.setSpacing(self._s[15])
 
         title = QLabel()
-        title.setStyleSheet(
-            f"color:white;font-size:{self.builder._scale_size(20)}px;"
-            f"font-family:'{self.builder._get_font_family()}';font-weight:bold;"
-        )
-        pl.addWidget(title)
-        self.builder.text_renderer.register_widget(title, "page_instances", group="instance_page")
-        title.setStyleSheet(
-            f"color:white;font-size:{self.builder._scale_size(20)}px;"
-            f"font-family:'{self.builder._get_font_family()}';font-weight:bold;"
-        )
+        title.setStyleSheet(self._get_qss("title"))
         pl.addWidget(title)
 
         # 注册到 TextRenderer
@@ -80,7 +260,7 @@ class InstancesPageBuilder:
         # 创建滚动区域
         scroll_area = self.builder._create_scroll_area()
         scroll_content, scroll_layout = self.builder._create_scroll_content(
-            margins=(0, self.builder._scale_size(10), 0, 0)
+            margins=(0, self._s[10], 0, 0)
         )
 
         # Minecraft路径选择区域
@@ -117,63 +297,33 @@ class InstancesPageBuilder:
     def _create_path_container(self):
         """创建路径选择容器"""
         path_container = QWidget()
-        path_container.setStyleSheet(
-            f"background:rgba(255,255,255,0.08);border-radius:{self.builder._scale_size(8)}px;"
-        )
+        path_container.setStyleSheet(self._get_qss("container"))
         path_layout = QVBoxLayout(path_container)
         path_layout.setContentsMargins(
-            self.builder._scale_size(15), self.builder._scale_size(12),
-            self.builder._scale_size(15), self.builder._scale_size(12)
+            self._s[15], self._s[12],
+            self._s[15], self._s[12]
         )
-        path_layout.setSpacing(self.builder._scale_size(10))
+        path_layout.setSpacing(self._s[10])
 
         # 路径标题
         path_title = QLabel()
-        path_title.setStyleSheet(
-            f"color:white;font-size:{self.builder._scale_size(14)}px;font-weight:bold;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
-        path_layout.addWidget(path_title)
-        self.builder.text_renderer.register_widget(path_title, "instance_path_title", group="instance_page")
-        path_title.setStyleSheet(
-            f"color:white;font-size:{self.builder._scale_size(14)}px;font-weight:bold;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
+        path_title.setStyleSheet(self._get_qss("section_title"))
         path_layout.addWidget(path_title)
-
         self.builder.text_renderer.register_widget(path_title, "instance_path_title", group="instance_page")
 
         # 路径描述
         path_desc = QLabel()
-        path_desc.setStyleSheet(
-            f"color:rgba(255,255,255,0.6);font-size:{self.builder._scale_size(12)}px;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
-        path_desc.setWordWrap(True)
-        path_layout.addWidget(path_desc)
-        self.builder.text_renderer.register_widget(path_desc, "instance_path_desc", group="instance_page")
-        path_desc.setStyleSheet(
-            f"color:rgba(255,255,255,0.6);font-size:{self.builder._scale_size(12)}px;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
+        path_desc.setStyleSheet(self._get_qss("desc"))
         path_desc.setWordWrap(True)
         path_layout.addWidget(path_desc)
-
         self.builder.text_renderer.register_widget(path_desc, "instance_path_desc", group="instance_page")
 
         # 路径输入和选择按钮
         path_input_layout = QHBoxLayout()
-        path_input_layout.setSpacing(self.builder._scale_size(10))
+        path_input_layout.setSpacing(self._s[10])
 
         self.builder.window.instance_path_input = QLineEdit()
         self.builder.window.instance_path_input.setStyleSheet(self.builder._get_lineedit_stylesheet())
-        self.builder.text_renderer.register_widget(
-            self.builder.window.instance_path_input,
-            "instance_path_placeholder",
-            update_method="setPlaceholderText",
-            group="instance_page"
-        )
-        self.builder.window.instance_path_input.setStyleSheet(self.builder._get_lineedit_stylesheet())
         self.builder.window.instance_path_input.editingFinished.connect(self._on_instance_path_changed)
         path_input_layout.addWidget(self.builder.window.instance_path_input, 1)
 
@@ -186,8 +336,8 @@ class InstancesPageBuilder:
 
         # 浏览按钮
         browse_btn = ClickableLabel()
-        browse_btn.setFixedSize(self.builder._scale_size(32), self.builder._scale_size(32))
-        border_radius_input = self.builder._scale_size(4)
+        browse_btn.setFixedSize(self._s[32], self._s[32])
+        border_radius_input = self._s[4]
         browse_btn.setHoverStyle(
             f"background:rgba(255,255,255,0.1);border:none;border-radius:{border_radius_input}px;",
             f"background:rgba(255,255,255,0.15);border:none;border-radius:{border_radius_input}px;"
@@ -207,46 +357,37 @@ class InstancesPageBuilder:
     def _create_version_container(self):
         """创建版本列表容器"""
         version_container = QWidget()
-        version_container.setStyleSheet(
-            f"background:rgba(255,255,255,0.08);border-radius:{self.builder._scale_size(8)}px;"
-        )
+        version_container.setStyleSheet(self._get_qss("container"))
         version_container_layout = QVBoxLayout(version_container)
         version_container_layout.setContentsMargins(
-            self.builder._scale_size(15), self.builder._scale_size(12),
-            self.builder._scale_size(15), self.builder._scale_size(12)
+            self._s[15], self._s[12],
+            self._s[15], self._s[12]
         )
-        version_container_layout.setSpacing(self.builder._scale_size(8))
+        version_container_layout.setSpacing(self._s[8])
 
         # 版本列表标题
         version_title = QLabel()
-        version_title.setStyleSheet(
-            f"color:white;font-size:{self.builder._scale_size(14)}px;font-weight:bold;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
+        version_title.setStyleSheet(self._get_qss("section_title"))
         version_container_layout.addWidget(version_title)
         self.builder.text_renderer.register_widget(version_title, "instance_version_label", group="instance_page")
-        version_title.setStyleSheet(
-            f"color:white;font-size:{self.builder._scale_size(14)}px;font-weight:bold;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
-        version_container_layout.addWidget(version_title)
 
-        self.builder.text_renderer.register_widget(version_title, "instance_version_label", group="instance_page")
+        # 版本列表容器引用，用于动态更新
+        self.builder.window.instance_version_container = version_container
+        version_container_layout.addWidget(self._create_version_list_widget())
+
+        return version_container
 
-        # 版本列表（滚动区域）
+    def _create_version_list_widget(self):
+        """创建版本列表控件并更新窗口上的引用"""
         version_list_widget = QWidget()
         version_list_layout = QVBoxLayout(version_list_widget)
         version_list_layout.setContentsMargins(0, 0, 0, 0)
-        version_list_layout.setSpacing(self.builder._scale_size(6))
+        version_list_layout.setSpacing(self._s[6])
 
-        # 版本列表容器引用，用于动态更新
         self.builder.window.instance_version_list_container = version_list_layout
-        self.builder.window.instance_version_container = version_container
         self.builder.window.instance_version_list_widget = version_list_widget
 
-        version_container_layout.addWidget(version_list_widget)
-
-        return version_container
+        return version_list_widget
 
     def _create_root_resourcepacks_container(self):
         """创建根目录材质包容器"""
@@ -256,22 +397,31 @@ class InstancesPageBuilder:
         root_resourcepacks_layout.setContentsMargins(0, 0, 0, 0)
         root_resourcepacks_layout.setSpacing(0)
 
-        # 创建文件浏览器用于显示根目录材质包（无滚动模式，不显示关闭按钮）
-        self.builder.window.root_resourcepacks_explorer = FileExplorer(
-            dpi_scale=self.builder.dpi_scale,
-            config_manager=self.builder.window.config_manager,
-            language_manager=self.builder.window.language_manager,
-            text_renderer=self.builder.text_renderer,
-            no_scroll=True,
-            show_close_button=False,
-            instances_page_builder=self
-        )
-        root_resourcepacks_layout.addWidget(self.builder.window.root_resourcepacks_explorer)
-
+        # 文件浏览器在版本隔离关闭、容器第一次显示时才创建
+        self.builder.window.root_resourcepacks_explorer = None
         self.builder.window.root_resourcepacks_container = root_resourcepacks_container
 
         return root_resourcepacks_container
 
+    def _ensure_root_resourcepacks_explorer(self):
+        """获取根目录材质包文件浏览器，首次使用时创建"""
+        if self.builder.window.root_resourcepacks_explorer is None:
+            from widgets import FileExplorer
+            # 创建文件浏览器用于显示根目录材质包（无滚动模式，不显示关闭按钮）
+            self.builder.window.root_resourcepacks_explorer = FileExplorer(
+                dpi_scale=self.builder.dpi_scale,
+                config_manager=self.builder.window.config_manager,
+                language_manager=self.builder.window.language_manager,
+                text_renderer=self.builder.text_renderer,
+                no_scroll=True,
+                show_close_button=False,
+                instances_page_builder=self
+            )
+            self.builder.window.root_resourcepacks_container.layout().addWidget(
+                self.builder.window.root_resourcepacks_explorer
+            )
+        return self.builder.window.root_resourcepacks_explorer
+
     def _create_instance_resourcepack_page(self, title, resourcepacks_path):
         """创建资源包页面（第二层）"""
         page = QWidget()
@@ -281,6 +431,7 @@ class InstancesPageBuilder:
         pl.setSpacing(0)
 
         # 文件浏览器（现在包含自己的标题和路径卡片）
+        from widgets import FileExplorer
         self.builder.window.file_explorer = FileExplorer(
             dpi_scale=self.builder.dpi_scale,
             config_manager=self.builder.window.config_manager,
@@ -306,15 +457,14 @@ class InstancesPageBuilder:
 
     def _setup_file_explorer_path(self, resourcepacks_path):
         """设置文件浏览器路径"""
-        minecraft_path = None
-        if "\\versions\\" in resourcepacks_path:
-            parts = resourcepacks_path.split("\\versions\\")
-            if len(parts) > 1:
-                minecraft_path = parts[0]
+        # 以 versions / resourcepacks 目录为锚点推出 Minecraft 根目录（跨平台）
+        parts = os.path.normpath(resourcepacks_path).split(os.sep)
+        if "versions" in parts:
+            minecraft_path = os.sep.join(parts[:parts.index("versions")])
+        elif "resourcepacks" in parts:
+            minecraft_path = os.sep.join(parts[:parts.index("resourcepacks")])
         else:
-            parts = resourcepacks_path.split("\\resourcepacks")
-            if len(parts) > 1:
-                minecraft_path = parts[0]
+            minecraft_path = None
 
         if minecraft_path:
             self.builder.window.file_explorer.set_resourcepacks_path(resourcepacks_path, minecraft_path)
@@ -344,7 +494,11 @@ class InstancesPageBuilder:
             self._on_instance_path_changed()
 
     def _on_instance_path_changed(self):
-        """Minecraft路径变化"""
+        """Minecraft路径变化（防抖，短时间内多次触发只重新加载一次）"""
+        self._reload_timer.start(150)
+
+    def _reload_instance_path(self):
+        """按输入框中的路径重新加载版本列表"""
         try:
             path = self.builder.window.instance_path_input.text().strip()
             if path and os.path.exists(path):
@@ -353,7 +507,7 @@ class InstancesPageBuilder:
                 self._load_version_list(path)
             else:
                 self._clear_version_list()
-                if hasattr(self.builder.window, 'download_version_combo'):
+                if self.builder.window.download_version_combo is not None:
                     self.builder.window.download_version_combo.clear()
         except Exception as e:
             logger.error(f"Error loading version list: {e}")
@@ -365,82 +519,109 @@ class InstancesPageBuilder:
             # 如果版本隔离关闭，直接在版本列表位置显示根目录材质包
             if not self.builder.window.config.get("version_isolation", True):
                 self._clear_version_list()
-                if hasattr(self.builder.window, 'instance_version_container'):
+                if self.builder.window.instance_version_container is not None:
                     self.builder.window.instance_version_container.setVisible(False)
-                if hasattr(self.builder.window, 'root_resourcepacks_container'):
+                if self.builder.window.root_resourcepacks_container is not None:
                     self.builder.window.root_resourcepacks_container.setVisible(True)
                     root_resourcepacks_path = os.path.join(minecraft_path, "resourcepacks")
                     if os.path.exists(root_resourcepacks_path):
-                        self.builder.window.root_resourcepacks_explorer.set_resourcepacks_path(
+                        self._ensure_root_resourcepacks_explorer().set_resourcepacks_path(
                             root_resourcepacks_path, minecraft_path
                         )
                 return
 
             # 显示版本容器，隐藏根目录材质包容器
-            if hasattr(self.builder.window, 'instance_version_container'):
+            if self.builder.window.instance_version_container is not None:
                 self.builder.window.instance_version_container.setVisible(True)
-            if hasattr(self.builder.window, 'root_resourcepacks_container'):
+            if self.builder.window.root_resourcepacks_container is not None:
                 self.builder.window.root_resourcepacks_container.setVisible(False)
 
             versions_path = os.path.join(minecraft_path, "versions")
             self._clear_version_list()
 
-            # 获取收藏的版本列表
-            favorited_versions = self.builder.window.config.get("favorited_versions", [])
-
-            # 收集所有版本
-            all_versions = []
-            if os.path.exists(versions_path) and os.path.isdir(versions_path):
-                for item in sorted(os.listdir(versions_path)):
-                    item_path = os.path.join(versions_path, item)
-                    if os.path.isdir(item_path):
-                        all_versions.append(item)
-
-            # 将版本分为收藏和非收藏两组
-            favorites = [v for v in all_versions if v in favorited_versions]
-            non_favorites = [v for v in all_versions if v not in favorited_versions]
+            if minecraft_path != self._version_type_cache_root:
+                self._version_type_cache.clear()
+                self._version_type_cache_root = minecraft_path
 
-            # 先添加收藏的版本
-            for version in favorites:
-                self._add_version_item(minecraft_path, version, is_version=True, is_favorited=True)
+            # 获取收藏的版本集合和版本别名
+            favorited_versions = frozenset(self.builder.window.config.get("favorited_versions", ()))
+            version_aliases = self.builder.window.config.get("version_aliases", {})
 
-            # 再添加非收藏的版本
-            for version in non_favorites:
-                self._add_version_item(minecraft_path, version, is_version=True, is_favorited=False)
+            # 收集所有版本（DirEntry 自带目录类型信息，无需逐个 stat）
+            version_entries = []
+            if os.path.isdir(versions_path):
+                with os.scandir(versions_path) as it:
+                    version_entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+
+            # 批量检测版本类型
+            version_types = self._detect_version_types(minecraft_path, version_entries)
+
+            # 建立版本目录，同时一次遍历将版本分为收藏和非收藏两组
+            favorites, non_favorites = [], []
+            for dir_entry in version_entries:
+                name = dir_entry.name
+                entry = _VersionEntry(name, dir_entry.path, version_types[name],
+                                      name in favorited_versions, version_aliases.get(name))
+                self._catalog[name] = entry
+                (favorites if entry.favorited else non_favorites).append(entry)
+
+            # 批量添加版本卡片期间暂停重绘，结束后只做一次布局更新
+            list_widget = self.builder.window.instance_version_list_widget
+            list_widget.setUpdatesEnabled(False)
+            list_widget.blockSignals(True)
+            try:
+                # 先添加收藏的版本
+                for entry in favorites:
+                    self._add_version_item(minecraft_path, entry.name, is_version=True, is_favorited=True,
+                                           version_entry=entry)
+
+                # 再添加非收藏的版本
+                for entry in non_favorites:
+                    self._add_version_item(minecraft_path, entry.name, is_version=True, is_favorited=False,
+                                           version_entry=entry)
+            finally:
+                list_widget.blockSignals(False)
+                list_widget.setUpdatesEnabled(True)
+                list_widget.updateGeometry()
 
         except Exception as e:
             logger.error(f"Error loading version list: {e}")
             pass
 
     def _clear_version_list(self):
-        """清空版本列表"""
-        if hasattr(self.builder.window, 'instance_version_list_container'):
-            while self.builder.window.instance_version_list_container.count() > 0:
-                child = self.builder.window.instance_version_list_container.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
-
-    def _add_version_item(self, minecraft_path, version_name, is_version=False, is_favorited=False):
-        """添加一个版本项到列表"""
+        """清空版本列表
+
+        直接用新的空列表控件替换旧控件，旧控件连同所有版本卡片一次性销毁，
+        避免逐个移除卡片时反复触发布局计算
+        """
+        self._catalog = {}
+        if self.builder.window.instance_version_list_container is None:
+            return
+        if self.builder.window.instance_version_list_container.count() == 0:
+            return
+
+        old_widget = self.builder.window.instance_version_list_widget
+        new_widget = self._create_version_list_widget()
+        self.builder.window.instance_version_container.layout().replaceWidget(old_widget, new_widget)
+        old_widget.setParent(None)
+        old_widget.deleteLater()
+
+    def _add_version_item(self, minecraft_path, version_name, is_version=False, is_favorited=False,
+                          version_entry=None):
+        """添加一个版本项到列表
+
+        version_entry 为版本目录中的 _VersionEntry，提供时直接使用其中的版本类型和别名，
+        并记录创建的卡片；未提供时单独检测
+        """
         from widgets import make_transparent
         from .components import VersionCardWidget
 
         # 创建版本卡片
         version_card = VersionCardWidget()
-        version_card.setFixedHeight(self.builder._scale_size(48))
+        version_card.setFixedHeight(self._s[48])
 
-        normal_style = f"""
-            QWidget {{
-                background: rgba(255, 255, 255, 0.08);
-                border-radius: {self.builder._scale_size(8)}px;
-            }}
-        """
-        hover_style = f"""
-            QWidget {{
-                background: rgba(255, 255, 255, 0.15);
-                border-radius: {self.builder._scale_size(8)}px;
-            }}
-        """
+        normal_style = self._get_qss("card_normal")
+        hover_style = self._get_qss("card_hover")
         version_card.set_styles(normal_style, hover_style)
         version_card.setStyleSheet(normal_style)
         version_card.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -448,85 +629,60 @@ class InstancesPageBuilder:
         # 确定资源包路径和显示名称
         if is_version:
             resourcepacks_path = os.path.join(minecraft_path, "versions", version_name, "resourcepacks")
-            version_aliases = self.builder.window.config.get("version_aliases", {})
-            display_name = version_aliases.get(version_name, version_name)
+            if version_entry is not None:
+                display_name = version_entry.alias or version_name
+            else:
+                version_aliases = self.builder.window.config.get("version_aliases", {})
+                display_name = version_aliases.get(version_name, version_name)
         else:
             resourcepacks_path = os.path.join(minecraft_path, "resourcepacks")
             display_name = self.builder.window.language_manager.translate("instance_version_root")
 
         # 卡片内容布局
-        card_layout = QHBoxLayout(version_card)
-        card_layout.setContentsMargins(self.builder._scale_size(12), 0, self.builder._scale_size(12), 0)
-        card_layout.setSpacing(self.builder._scale_size(10))
+        card_layout = self._make_card_hlayout(version_card, self._s[12], self._s[12])
 
         # 创建点击区域容器
         click_area = ClickableLabel()
         click_area.setStyleSheet("background:transparent;")
         click_area.setCallback(lambda rp=resourcepacks_path, dn=display_name: self._navigate_to_resourcepack_page(dn, rp))
-        click_area_layout = QHBoxLayout(click_area)
-        click_area_layout.setContentsMargins(0, 0, 0, 0)
-        click_area_layout.setSpacing(self.builder._scale_size(10))
+        click_area_layout = self._make_card_hlayout(click_area, 0, 0)
 
         # 图标
         icon_label = QLabel()
-        icon_label.setFixedSize(self.builder._scale_size(32), self.builder._scale_size(32))
+        icon_label.setFixedSize(self._s[32], self._s[32])
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         icon_label.setStyleSheet("background:transparent;")
 
         # 判断版本类型并选择图标
         if is_version:
-            version_type = self._detect_version_type(minecraft_path, version_name)
-            if version_type == "fabric":
-                icon_path = "png/fabric.png"
-            elif version_type == "forge":
-                icon_path = "png/forge.png"
-            elif version_type == "neoforge":
-                icon_path = "png/neoforged.png"
+            if version_entry is not None:
+                version_type = version_entry.version_type
             else:
-                icon_path = "png/block.png"
-
-            # 获取 PNG 文件的正确路径
-            if hasattr(sys, '_MEIPASS'):
-                png_path = os.path.join(sys._MEIPASS, icon_path.replace('\\', os.sep))
-                if not os.path.exists(png_path):
-                    png_path = os.path.join(os.getcwd(), icon_path.replace('\\', os.sep))
-            else:
-                png_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", icon_path.replace('\\', os.sep))
-                png_path = os.path.abspath(png_path)
-
-            icon_pixmap = QPixmap(png_path)
-            if not icon_pixmap.isNull():
-                scaled_pixmap = icon_pixmap.scaled(
-                    int(20 * self.builder.dpi_scale),
-                    int(20 * self.builder.dpi_scale),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                icon_label.setPixmap(scaled_pixmap)
+                version_type = self._detect_version_type(minecraft_path, version_name)
+            icon_path = _VERSION_ICONS.get(version_type, "png/block.png")
         else:
-            icon_pixmap = load_svg_icon("svg/box-fill.svg", self.builder.dpi_scale)
-            if icon_pixmap:
-                icon_label.setPixmap(scale_icon_for_display(icon_pixmap, 20, self.builder.dpi_scale))
+            icon_path = "svg/box-fill.svg"
+
+        icon_pixmap = self._cached_pixmap(icon_path, 20)
+        if not icon_pixmap.isNull():
+            icon_label.setPixmap(icon_pixmap)
 
         click_area_layout.addWidget(icon_label)
 
         # 版本名称
         name_label = QLabel(display_name)
-        name_label.setStyleSheet(
-            f"color:white;font-size:{self.builder._scale_size(14)}px;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
+        name_label.setStyleSheet(self._get_qss("name"))
         click_area_layout.addWidget(name_label)
         click_area_layout.addStretch()
 
         # 箭头图标
         arrow_label = QLabel()
-        arrow_label.setFixedSize(self.builder._scale_size(20), self.builder._scale_size(20))
+        arrow_label.setFixedSize(self._s[20], self._s[20])
         arrow_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         arrow_label.setStyleSheet("background:transparent;")
-        arrow_pixmap = load_svg_icon("svg/arrow-bar-right.svg", self.builder.dpi_scale)
-        if arrow_pixmap:
-            arrow_label.setPixmap(scale_icon_for_display(arrow_pixmap, 16, self.builder.dpi_scale))
+        arrow_pixmap = self._cached_pixmap("svg/arrow-bar-right.svg", 16)
+        if not arrow_pixmap.isNull():
+            arrow_label.setPixmap(arrow_pixmap)
         click_area_layout.addWidget(arrow_label)
 
         card_layout.addWidget(click_area)
@@ -537,65 +693,40 @@ class InstancesPageBuilder:
 
         if is_version:
             # 编辑按钮
-            from PyQt6.QtWidgets import QPushButton
-            from PyQt6.QtGui import QIcon
-
             edit_btn = QPushButton()
-            edit_btn.setFixedSize(self.builder._scale_size(20), self.builder._scale_size(20))
+            edit_btn.setFixedSize(self._s[20], self._s[20])
             edit_btn.hide()
-            edit_btn.setStyleSheet("""
-                QPushButton {
-                    background: transparent;
-                    border: none;
-                    padding: 0;
-                }
-                QPushButton:hover {
-                    background: rgba(255, 255, 255, 0.1);
-                    border-radius: 4px;
-                }
-            """)
+            edit_btn.setStyleSheet(_BTN_QSS)
             edit_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            edit_btn.clicked.connect(lambda: self._edit_version_name(version_name, name_label))
+            edit_btn._version_name = version_name
+            edit_btn._name_label = name_label
+            edit_btn.clicked.connect(self._on_edit_clicked)
 
-            edit_pixmap = load_svg_icon("svg/pencil-square.svg", self.builder.dpi_scale)
-            if edit_pixmap:
-                edit_btn.setIcon(QIcon(scale_icon_for_display(edit_pixmap, 16, self.builder.dpi_scale)))
+            edit_btn.setIcon(self._cached_qicon("svg/pencil-square.svg", 16))
 
             version_card.set_edit_button(edit_btn)
             card_layout.addWidget(edit_btn)
 
             # 收藏按钮
             bookmark_btn = QPushButton()
-            bookmark_btn.setFixedSize(self.builder._scale_size(20), self.builder._scale_size(20))
-            bookmark_btn.setStyleSheet("""
-                QPushButton {
-                    background: transparent;
-                    border: none;
-                    padding: 0;
-                }
-                QPushButton:hover {
-                    background: rgba(255, 255, 255, 0.1);
-                    border-radius: 4px;
-                }
-            """)
+            bookmark_btn.setFixedSize(self._s[20], self._s[20])
+            bookmark_btn.setStyleSheet(_BTN_QSS)
             bookmark_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            bookmark_btn.clicked.connect(lambda: self._toggle_favorite_version(version_name))
+            bookmark_btn._version_name = version_name
+            bookmark_btn.clicked.connect(self._on_bookmark_clicked)
 
+            # 未收藏的版本仅在悬停时显示收藏图标（由 VersionCardWidget 处理）
             if is_favorited:
-                bookmark_pixmap = load_svg_icon("svg/bookmarks-fill.svg", self.builder.dpi_scale)
-            else:
-                bookmark_pixmap = load_svg_icon("svg/bookmarks.svg", self.builder.dpi_scale)
-
-            if bookmark_pixmap:
-                bookmark_btn.setIcon(QIcon(scale_icon_for_display(bookmark_pixmap, 16, self.builder.dpi_scale)))
+                bookmark_btn.setIcon(self._cached_qicon("svg/bookmarks-fill.svg", 16))
 
             version_card.set_bookmark_info(bookmark_btn, is_favorited)
 
-            if not is_favorited:
-                bookmark_btn.setIcon(QIcon())
-
             card_layout.addWidget(bookmark_btn)
 
+            if version_entry is not None:
+                version_entry.card = version_card
+                version_entry.bookmark_btn = bookmark_btn
+
         # 处理卡片的点击事件
         def mouse_press_handler(e):
             click_area.mousePressEvent(e)
@@ -608,23 +739,100 @@ class InstancesPageBuilder:
 
         self.builder.window.instance_version_list_container.addWidget(version_card)
 
+    def _make_card_hlayout(self, parent, left, right):
+        """创建版本卡片使用的水平布局（上下无边距，统一间距）"""
+        layout = QHBoxLayout(parent)
+        layout.setContentsMargins(left, 0, right, 0)
+        layout.setSpacing(self._s[10])
+        return layout
+
+    def _on_edit_clicked(self):
+        """版本卡片编辑按钮的共享槽函数（版本信息保存在按钮上）"""
+        sender = self.builder.window.sender()
+        if sender is not None:
+            self._edit_version_name(sender._version_name, sender._name_label)
+
+    def _on_bookmark_clicked(self):
+        """版本卡片收藏按钮的共享槽函数（版本信息保存在按钮上）"""
+        sender = self.builder.window.sender()
+        if sender is not None:
+            self._toggle_favorite_version(sender._version_name)
+
+    def _get_qss(self, name):
+        """获取格式化后的样式表（字体变化时才重新格式化）"""
+        font_family = self.builder._get_font_family()
+        if font_family != self._qss_font:
+            radius = self._s[8]
+            self._qss = {
+                "title": _TITLE_QSS.format(size=self._s[20], font=font_family),
+                "section_title": _SECTION_TITLE_QSS.format(size=self._s[14], font=font_family),
+                "desc": _DESC_QSS.format(size=self._s[12], font=font_family),
+                "name": _NAME_QSS.format(size=self._s[14], font=font_family),
+                "container": _CONTAINER_QSS.format(radius=radius),
+                "card_normal": _CARD_NORMAL_QSS.format(radius=radius),
+                "card_hover": _CARD_HOVER_QSS.format(radius=radius),
+                "dialog_title": _DIALOG_TITLE_QSS.format(size=self._s[14], font=font_family),
+                "dialog_input": _DIALOG_INPUT_QSS.format(
+                    radius=self._s[6], padding=self._s[12], size=self._s[14], font=font_family
+                ),
+                "dialog_cancel": _DIALOG_CANCEL_QSS.format(radius=self._s[6], size=self._s[13], font=font_family),
+                "dialog_confirm": _DIALOG_CONFIRM_QSS.format(radius=self._s[6], size=self._s[13], font=font_family),
+            }
+            self._qss_font = font_family
+        return self._qss[name]
+
+    def _cached_pixmap(self, icon_path, size):
+        """获取已缩放的图标（按路径、尺寸和DPI缓存，避免每个版本卡片重复加载和缩放）"""
+        key = (icon_path, size, self.builder.dpi_scale)
+        pixmap = self._ICON_CACHE.get(key)
+        if pixmap is None:
+            if icon_path.endswith(".svg"):
+                svg_pixmap = load_svg_icon(icon_path, self.builder.dpi_scale)
+                if svg_pixmap:
+                    pixmap = scale_icon_for_display(svg_pixmap, size, self.builder.dpi_scale)
+                else:
+                    pixmap = QPixmap()
+            else:
+                pixmap = QPixmap(os.path.join(_PNG_ROOT, icon_path))
+                if not pixmap.isNull():
+                    target_size = int(size * self.builder.dpi_scale)
+                    pixmap = pixmap.scaled(
+                        target_size, target_size,
+                        Qt.AspectRatioMode.KeepAspectRatio,
+                        Qt.TransformationMode.SmoothTransformation
+                    )
+            self._ICON_CACHE[key] = pixmap
+        return pixmap
+
+    def _cached_qicon(self, icon_path, size):
+        """获取已缩放的 QIcon（缓存同 _cached_pixmap）"""
+        key = (icon_path, size, self.builder.dpi_scale)
+        icon = self._QICON_CACHE.get(key)
+        if icon is None:
+            pixmap = self._cached_pixmap(icon_path, size)
+            icon = QIcon(pixmap) if not pixmap.isNull() else QIcon()
+            self._QICON_CACHE[key] = icon
+        return icon
+
     def _navigate_to_resourcepack_page(self, title, resourcepacks_path):
         """导航到资源包页面（第二层）"""
         logger.info(f"Navigating to resourcepack page: {title}, path: {normalize_path(resourcepacks_path)}")
 
-        # 检查是否已经存在相同路径的资源包页面
-        for i in range(self.builder.window.instance_stack.count()):
-            widget = self.builder.window.instance_stack.widget(i)
-            if hasattr(widget, '_resourcepacks_path') and widget._resourcepacks_path == resourcepacks_path:
-                self.builder.window.instance_stack.setCurrentIndex(i)
-                return
-
-        # 创建新的资源包页面
-        resourcepack_page = self._create_instance_resourcepack_page(title, resourcepacks_path)
-        resourcepack_page._resourcepacks_path = resourcepacks_path
-        self.builder.window.instance_stack.addWidget(resourcepack_page)
+        # 相同路径的资源包页面只创建一次
+        resourcepack_page = self._resourcepack_pages.get(resourcepacks_path)
+        if resourcepack_page is None:
+            resourcepack_page = self._create_instance_resourcepack_page(title, resourcepacks_path)
+            resourcepack_page._resourcepacks_path = resourcepacks_path
+            self._resourcepack_pages[resourcepacks_path] = resourcepack_page
+            self.builder.window.instance_stack.addWidget(resourcepack_page)
         self.builder.window.instance_stack.setCurrentWidget(resourcepack_page)
 
+    def _forget_resourcepack_page(self, widget):
+        """页面销毁前将其从资源包页面缓存中移除"""
+        resourcepacks_path = getattr(widget, '_resourcepacks_path', None)
+        if self._resourcepack_pages.get(resourcepacks_path) is widget:
+            del self._resourcepack_pages[resourcepacks_path]
+
     def _navigate_instance_back(self):
         """返回上一页"""
         count = self.builder.window.instance_stack.count()
@@ -632,6 +840,7 @@ class InstancesPageBuilder:
             return
 
         widget_to_remove = self.builder.window.instance_stack.currentWidget()
+        self._forget_resourcepack_page(widget_to_remove)
         self.builder.window.instance_stack.removeWidget(widget_to_remove)
         widget_to_remove.deleteLater()
 
@@ -642,6 +851,7 @@ class InstancesPageBuilder:
         while count > 1:
             widget_to_remove = self.builder.window.instance_stack.widget(1)
             if widget_to_remove:
+                self._forget_resourcepack_page(widget_to_remove)
                 self.builder.window.instance_stack.removeWidget(widget_to_remove)
                 widget_to_remove.deleteLater()
             count = self.builder.window.instance_stack.count()
@@ -698,83 +908,154 @@ class InstancesPageBuilder:
                 except:
                     pass
 
-    def _detect_version_type(self, minecraft_path, version_name):
-        """检测Minecraft版本类型（fabric/forge/neoforge/vanilla）"""
+    def _detect_version_type(self, minecraft_path, version_name, version_entry=None):
+        """检测Minecraft版本类型（fabric/forge/neoforge/vanilla）
+
+        结果按版本目录的修改时间以及版本 json 的修改时间和大小缓存，
+        只有安装、删除模组加载器或版本 json 被改写后才会重新检测
+        """
+        key_info = self._version_type_key(minecraft_path, version_name, version_entry)
+        if key_info is None:
+            return "vanilla"
+
+        key, version_path, has_json = key_info
+        version_type = self._get_cached_version_type(key)
+        if version_type is None:
+            version_type = self._probe_version_type(version_path, version_name, has_json)
+            self._cache_version_type(key, version_type)
+        return version_type
+
+    def _detect_version_types(self, minecraft_path, version_entries):
+        """批量检测版本类型，未命中缓存的版本在线程池中并行读取 json 和 jar
+
+        Returns:
+            dict: version_name -> 版本类型
+        """
+        version_types = {}
+        pending = []
+        for entry in version_entries:
+            key_info = self._version_type_key(minecraft_path, entry.name, entry)
+            if key_info is None:
+                version_types[entry.name] = "vanilla"
+                continue
+            key, version_path, has_json = key_info
+            version_type = self._get_cached_version_type(key)
+            if version_type is None:
+                pending.append((entry.name, key, version_path, has_json))
+            else:
+                version_types[entry.name] = version_type
+
+        def probe(item):
+            version_name, _, version_path, has_json = item
+            return self._probe_version_type(version_path, version_name, has_json)
+
+        if len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=min(_VERSION_TYPE_WORKERS, len(pending))) as executor:
+                results = list(executor.map(probe, pending))
+        else:
+            results = [probe(item) for item in pending]
+
+        # 缓存只在主线程中更新
+        for (version_name, key, _, _), version_type in zip(pending, results):
+            self._cache_version_type(key, version_type)
+            version_types[version_name] = version_type
+        return version_types
+
+    def _version_type_key(self, minecraft_path, version_name, version_entry=None):
+        """获取版本类型缓存键
+
+        Returns:
+            tuple: (缓存键, 版本目录, 是否存在版本 json)，版本目录无法访问时返回 None
+        """
         try:
-            version_path = os.path.join(minecraft_path, "versions", version_name)
-            if not os.path.exists(version_path):
-                return "vanilla"
+            if version_entry is not None:
+                version_path = version_entry.path
+                mtime = version_entry.stat().st_mtime_ns
+            else:
+                version_path = os.path.join(minecraft_path, "versions", version_name)
+                mtime = os.stat(version_path).st_mtime_ns
+        except OSError:
+            return None
 
-            # 查找版本jar文件或目录
+        try:
+            st_json = os.stat(os.path.join(version_path, version_name + ".json"))
+            json_key = (st_json.st_mtime_ns, st_json.st_size)
+        except OSError:
+            json_key = None
+
+        return (version_path, mtime, json_key), version_path, json_key is not None
+
+    def _get_cached_version_type(self, key):
+        """从缓存中取出版本类型，未命中时返回 None"""
+        version_type = self._version_type_cache.get(key)
+        if version_type is not None:
+            self._version_type_cache.move_to_end(key)
+        return version_type
+
+    def _cache_version_type(self, key, version_type):
+        """写入版本类型缓存，超出上限时淘汰最久未使用的条目"""
+        cache = self._version_type_cache
+        cache[key] = version_type
+        if len(cache) > _VERSION_TYPE_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _probe_version_type(self, version_path, version_name, has_json=True):
+        """读取版本的 json 和 jar 文件判断版本类型
+
+        has_json 由调用方根据已有的 stat 结果给出，避免重复检查 json 是否存在
+        """
+        try:
+            # 查找版本jar文件或目录（一次 stat 同时判断是否存在以及是否为文件）
             version_jar = os.path.join(version_path, version_name + ".jar")
-            if not os.path.exists(version_jar):
-                version_jar = os.path.join(version_path, version_name)
-                if os.path.isdir(version_jar):
-                    for item in os.listdir(version_jar):
-                        if item.endswith(".jar"):
-                            version_jar = os.path.join(version_jar, item)
-                            break
+            try:
+                jar_found = stat.S_ISREG(os.stat(version_jar).st_mode)
+            except OSError:
+                jar_found = False
+
+            if not jar_found:
+                # 在版本子目录中找到第一个jar文件即停止遍历
+                try:
+                    with os.scandir(os.path.join(version_path, version_name)) as it:
+                        version_jar = next(
+                            (entry.path for entry in it if entry.name.endswith(".jar") and entry.is_file()),
+                            None,
+                        )
+                except OSError:
+                    version_jar = None
+                if version_jar is None:
+                    return "vanilla"
 
-            if not os.path.exists(version_jar) or not os.path.isfile(version_jar):
-                return "vanilla"
+            # 先按版本名称判断，名称中带有加载器标识时无需读取json和jar
+            version_type = _loader_from_text(version_name)
+            if version_type:
+                return version_type
 
             # 检查json文件
             version_json = os.path.join(version_path, version_name + ".json")
-            if os.path.exists(version_json):
+            if has_json:
                 with open(version_json, 'r', encoding='utf-8') as f:
                     json_data = json.load(f)
 
-                    if "inheritsFrom" in json_data:
-                        parent_version = json_data["inheritsFrom"]
-                        if "forge" in version_name.lower():
-                            return "forge"
-                        elif "neoforge" in version_name.lower():
-                            return "neoforge"
-                        elif "fabric" in version_name.lower():
-                            return "fabric"
-
-                    if "id" in json_data:
-                        version_id = json_data["id"].lower()
-                        if "forge" in version_id and "neoforge" not in version_id:
-                            return "forge"
-                        elif "neoforge" in version_id:
-                            return "neoforge"
-                        elif "fabric" in version_id:
-                            return "fabric"
-
-                    if "version" in json_data:
-                        version_val = json_data["version"].lower()
-                        if "forge" in version_val and "neoforge" not in version_val:
-                            return "forge"
-                        elif "neoforge" in version_val:
-                            return "neoforge"
-                        elif "fabric" in version_val:
-                            return "fabric"
+                for key in ("id", "version"):
+                    if key in json_data:
+                        version_type = _loader_from_text(json_data[key])
+                        if version_type:
+                            return version_type
 
-            # 检查jar文件中的fabric.mod.json
+            # 检查jar文件中的fabric.mod.json和mods.toml（直接查条目字典，只有找到mods.toml时才遍历条目区分neoforge）
+            import zipfile
             try:
                 with zipfile.ZipFile(version_jar, 'r') as jar_file:
-                    mod_json_files = [f for f in jar_file.namelist() if 'fabric.mod.json' in f]
-                    if mod_json_files:
+                    entries = jar_file.NameToInfo
+                    if _FABRIC_MOD_JSON in entries:
                         return "fabric"
-
-                    mods_toml_files = [f for f in jar_file.namelist() if 'mods.toml' in f]
-                    if mods_toml_files:
-                        for f in jar_file.namelist():
-                            if 'neoforge' in f.lower():
-                                return "neoforge"
+                    if any(name in entries for name in _MODS_TOML_ENTRIES):
+                        if any(_NEOFORGE_RE.search(name) for name in entries):
+                            return "neoforge"
                         return "forge"
             except:
                 pass
 
-            version_lower = version_name.lower()
-            if "neoforge" in version_lower:
-                return "neoforge"
-            elif "forge" in version_lower:
-                return "forge"
-            elif "fabric" in version_lower:
-                return "fabric"
-
             return "vanilla"
         except Exception as e:
             logger.error(f"Error detecting version type for {version_name}: {e}")
@@ -784,118 +1065,107 @@ class InstancesPageBuilder:
         """编辑版本名称"""
         current_name = name_label.text()
 
+        config = self.builder.window.config
+
         # 获取主窗口背景模式，使用相同的背景设置
-        background_mode = self.builder.window.config.get("background_mode", "blur")
+        background_mode = config.get("background_mode", "blur")
 
-        if background_mode == "blur":
-            blur_opacity = self.builder.window.config.get("blur_opacity", 150)
-            dialog_opacity = min(255, blur_opacity + 50)
-            opacity_alpha = dialog_opacity / 255.0
-            dialog_style = f"""
-                QDialog {{
-                    background: rgba(0, 0, 0, {opacity_alpha});
-                    border: 1px solid rgba(255, 255, 255, 0.3);
-                    border-radius: {self.builder._scale_size(12)}px;
-                }}
-            """
-        elif background_mode == "solid":
-            bg_color = self.builder.window.config.get("background_color", "#00000000")
-            dialog_style = f"""
-                QDialog {{
-                    background: {bg_color};
-                    border: 1px solid rgba(255, 255, 255, 0.3);
-                    border-radius: {self.builder._scale_size(12)}px;
-                }}
-            """
+        if background_mode == "solid":
+            background = config.get("background_color", "#00000000")
         else:
-            blur_opacity = self.builder.window.config.get("blur_opacity", 150)
+            blur_opacity = config.get("blur_opacity", 150)
             dialog_opacity = min(255, blur_opacity + 50)
-            opacity_alpha = dialog_opacity / 255.0
-            dialog_style = f"""
-                QDialog {{
-                    background: rgba(0, 0, 0, {opacity_alpha});
-                    border: 1px solid rgba(255, 255, 255, 0.3);
-                    border-radius: {self.builder._scale_size(12)}px;
-                }}
-            """
+            background = f"rgba(0, 0, 0, {dialog_opacity / 255.0})"
+        dialog_style = _DIALOG_QSS.format(background=background, radius=self._s[12])
+
+        # 对话框只创建一次，之后复用；背景设置或字体变化时才重新设置样式
+        if self._edit_dialog is None:
+            self._build_edit_dialog()
+        dialog = self._edit_dialog
+        if dialog.styleSheet() != dialog_style:
+            dialog.setStyleSheet(dialog_style)
+        if self._edit_dialog_font != self.builder._get_font_family():
+            self._apply_edit_dialog_styles()
+
+        input_field = self._edit_input
+        input_field.setText(current_name)
+        input_field.selectAll()
+        input_field.setFocus()
 
-        # 创建自定义对话框（无标题栏）
+        result = dialog.exec()
+
+        if result == QDialog.DialogCode.Accepted:
+            new_name = input_field.text().strip()
+            if new_name:
+                version_aliases = config.get("version_aliases", {})
+
+                entry = self._catalog.get(original_name)
+                if new_name == original_name:
+                    if original_name in version_aliases:
+                        del version_aliases[original_name]
+                        config["version_aliases"] = version_aliases
+                        self._schedule_config_save()
+                        name_label.setText(original_name)
+                        if entry is not None:
+                            entry.alias = None
+                else:
+                    version_aliases[original_name] = new_name
+                    config["version_aliases"] = version_aliases
+                    self._schedule_config_save()
+                    name_label.setText(new_name)
+                    if entry is not None:
+                        entry.alias = new_name
+
+    def _schedule_config_save(self):
+        """延迟保存配置，连续多次修改只写一次磁盘（退出程序前会立即保存）"""
+        self._config_save_pending = True
+        self._config_save_timer.start(500)
+
+    def _flush_config_save(self):
+        """立即写入尚未保存的配置"""
+        if not self._config_save_pending:
+            return
+        self._config_save_timer.stop()
+        self._config_save_pending = False
+        self.builder.window.config_manager.save_config()
+
+    def _build_edit_dialog(self):
+        """创建重命名对话框（无标题栏），创建后缓存复用"""
         dialog = QDialog(self.builder.window)
         dialog.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.Dialog)
-        dialog.setFixedSize(self.builder._scale_size(400), self.builder._scale_size(180))
+        dialog.setFixedSize(self._s[400], self._s[180])
         dialog.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        dialog.setStyleSheet(dialog_style)
+        dialog.setWindowModality(Qt.WindowModality.ApplicationModal)
 
         # 对话框布局
         dialog_layout = QVBoxLayout(dialog)
         dialog_layout.setContentsMargins(
-            self.builder._scale_size(24), self.builder._scale_size(24),
-            self.builder._scale_size(24), self.builder._scale_size(24)
+            self._s[24], self._s[24],
+            self._s[24], self._s[24]
         )
-        dialog_layout.setSpacing(self.builder._scale_size(16))
+        dialog_layout.setSpacing(self._s[16])
 
         # 标题标签
         title_label = QLabel()
         self.builder.text_renderer.register_widget(title_label, "edit_version_name_title", group="instance_page")
-        title_label.setStyleSheet(f"""
-            QLabel {{
-                color: rgba(255, 255, 255, 0.9);
-                background: transparent;
-                font-size: {self.builder._scale_size(14)}px;
-                font-family: '{self.builder._get_font_family()}';
-            }}
-        """)
         dialog_layout.addWidget(title_label)
 
         # 输入框
-        input_field = QLineEdit(current_name)
-        input_field.setFixedHeight(self.builder._scale_size(36))
-        input_field.setStyleSheet(f"""
-            QLineEdit {{
-                background: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: {self.builder._scale_size(6)}px;
-                padding: 0 {self.builder._scale_size(12)}px;
-                color: rgba(255, 255, 255, 0.9);
-                font-size: {self.builder._scale_size(14)}px;
-                font-family: '{self.builder._get_font_family()}';
-            }}
-            QLineEdit:focus {{
-                background: rgba(255, 255, 255, 0.15);
-                border: 1px solid rgba(100, 150, 255, 0.6);
-            }}
-        """)
-        input_field.selectAll()
+        input_field = QLineEdit()
+        input_field.setFixedHeight(self._s[36])
         dialog_layout.addWidget(input_field)
 
         dialog_layout.addStretch()
 
         # 按钮布局
         button_layout = QHBoxLayout()
-        button_layout.setSpacing(self.builder._scale_size(10))
+        button_layout.setSpacing(self._s[10])
 
         # 取消按钮
         cancel_btn = QPushButton()
         self.builder.text_renderer.register_widget(cancel_btn, "cancel", group="instance_page")
-        cancel_btn.setFixedHeight(self.builder._scale_size(36))
-        cancel_btn.setFixedWidth(self.builder._scale_size(100))
-        cancel_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: rgba(255, 255, 255, 0.08);
-                border: 1px solid rgba(255, 255, 255, 0.15);
-                border-radius: {self.builder._scale_size(6)}px;
-                color: rgba(255, 255, 255, 0.9);
-                font-size: {self.builder._scale_size(13)}px;
-                font-family: '{self.builder._get_font_family()}';
-                padding: 0;
-            }}
-            QPushButton:hover {{
-                background: rgba(255, 255, 255, 0.12);
-            }}
-            QPushButton:pressed {{
-                background: rgba(255, 255, 255, 0.08);
-            }}
-        """)
+        cancel_btn.setFixedHeight(self._s[36])
+        cancel_btn.setFixedWidth(self._s[100])
         cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         cancel_btn.clicked.connect(dialog.reject)
         button_layout.addWidget(cancel_btn)
@@ -903,25 +1173,8 @@ class InstancesPageBuilder:
         # 确认按钮
         confirm_btn = QPushButton()
         self.builder.text_renderer.register_widget(confirm_btn, "confirm", group="instance_page")
-        confirm_btn.setFixedHeight(self.builder._scale_size(36))
-        confirm_btn.setFixedWidth(self.builder._scale_size(100))
-        confirm_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: rgba(100, 150, 255, 0.8);
-                border: none;
-                border-radius: {self.builder._scale_size(6)}px;
-                color: white;
-                font-size: {self.builder._scale_size(13)}px;
-                font-family: '{self.builder._get_font_family()}';
-                padding: 0;
-            }}
-            QPushButton:hover {{
-                background: rgba(100, 150, 255, 1.0);
-            }}
-            QPushButton:pressed {{
-                background: rgba(100, 150, 255, 0.7);
-            }}
-        """)
+        confirm_btn.setFixedHeight(self._s[36])
+        confirm_btn.setFixedWidth(self._s[100])
         confirm_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         confirm_btn.clicked.connect(dialog.accept)
         button_layout.addWidget(confirm_btn)
@@ -929,37 +1182,68 @@ class InstancesPageBuilder:
         button_layout.addStretch()
         dialog_layout.addLayout(button_layout)
 
-        dialog.setWindowModality(Qt.WindowModality.ApplicationModal)
-        input_field.setFocus()
-
-        result = dialog.exec()
-
-        if result == QDialog.DialogCode.Accepted:
-            new_name = input_field.text().strip()
-            if new_name:
-                version_aliases = self.builder.window.config.get("version_aliases", {})
-
-                if new_name == original_name:
-                    if original_name in version_aliases:
-                        del version_aliases[original_name]
-                        self.builder.window.config_manager.set("version_aliases", version_aliases)
-                        name_label.setText(original_name)
-                else:
-                    version_aliases[original_name] = new_name
-                    self.builder.window.config_manager.set("version_aliases", version_aliases)
-                    name_label.setText(new_name)
+        self._edit_dialog = dialog
+        self._edit_title = title_label
+        self._edit_input = input_field
+        self._edit_cancel_btn = cancel_btn
+        self._edit_confirm_btn = confirm_btn
+        self._apply_edit_dialog_styles()
+
+    def _apply_edit_dialog_styles(self):
+        """设置重命名对话框内控件的样式（依赖字体）"""
+        self._edit_title.setStyleSheet(self._get_qss("dialog_title"))
+        self._edit_input.setStyleSheet(self._get_qss("dialog_input"))
+        self._edit_cancel_btn.setStyleSheet(self._get_qss("dialog_cancel"))
+        self._edit_confirm_btn.setStyleSheet(self._get_qss("dialog_confirm"))
+        self._edit_dialog_font = self._qss_font
 
     def _toggle_favorite_version(self, version_name):
         """切换版本的收藏状态"""
-        favorited_versions = self.builder.window.config.get("favorited_versions", [])
+        config = self.builder.window.config
+        favorited_versions = set(config.get("favorited_versions", ()))
 
         if version_name in favorited_versions:
-            favorited_versions.remove(version_name)
+            favorited_versions.discard(version_name)
         else:
-            favorited_versions.append(version_name)
+            favorited_versions.add(version_name)
 
-        self.builder.window.config_manager.set("favorited_versions", favorited_versions)
+        self.builder.window.config_manager.set("favorited_versions", sorted(favorited_versions))
 
-        saved_path = self.builder.window.config.get("minecraft_path", "")
+        # 只更新对应的卡片；卡片不在当前列表中时才整体重新加载
+        if self._update_favorite_card(version_name, version_name in favorited_versions):
+            return
+
+        saved_path = config.get("minecraft_path", "")
         if saved_path:
             self._load_version_list(saved_path)
+
+    def _update_favorite_card(self, version_name, is_favorited):
+        """更新版本的收藏状态和卡片图标，并把卡片移动到排序后的位置
+
+        Returns:
+            bool: 卡片存在并已更新时返回 True
+        """
+        entry = self._catalog.get(version_name)
+        if entry is None or entry.card is None:
+            return False
+
+        entry.favorited = is_favorited
+        version_card, bookmark_btn = entry.card, entry.bookmark_btn
+        version_card.set_bookmark_info(bookmark_btn, is_favorited)
+        if is_favorited:
+            bookmark_btn.setIcon(self._cached_qicon("svg/bookmarks-fill.svg", 16))
+        elif version_card.underMouse():
+            # 与悬停时的显示保持一致
+            bookmark_btn.setIcon(self._cached_qicon("svg/bookmarks.svg", 16))
+        else:
+            bookmark_btn.setIcon(QIcon())
+
+        # 与 _load_version_list 相同的顺序：收藏的在前，各组内按名称排序
+        index = sum(
+            1 for other in self._catalog.values()
+            if (not other.favorited, other.name) < (not is_favorited, version_name)
+        )
+        list_layout = self.builder.window.instance_version_list_container
+        list_layout.removeWidget(version_card)
+        list_layout.insertWidget(index, version_card)
+        return True
@@ -4,42 +4,160 @@
 """
 
 import logging
+from functools import lru_cache
+
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, 
                              QPushButton, QScrollArea, QSlider, QLineEdit)
 from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QFontDatabase, QStandardItemModel, QStandardItem
+
+from styles import SLIDER_STYLE
+from utils import load_display_icon
+from widgets import CardButton, ClickableLabel
+
+from .components import ToggleSwitch, LazyComboBox
 
 logger = logging.getLogger(__name__)
 
+# 页面中用到的缩放尺寸，构建器创建时按DPI计算一次
+_SCALED_SIZES = (2, 4, 6, 8, 10, 12, 13, 14, 15, 20, 28, 32, 35, 50, 70, 200)
+
+# 字体下拉框中排在最前面的常用字体
+_COMMON_FONTS = ("Microsoft YaHei UI", "SimHei", "Arial", "Segoe UI", "Helvetica")
+
+# 样式表模板，按当前字体和DPI格式化一次后复用
+_TITLE_QSS = "color:white;font-size:{size}px;font-family:'{font}';font-weight:bold;"
+_ITEM_TITLE_QSS = "color:white;font-size:{size}px;font-family:'{font}';"
+_DESC_QSS = "color:rgba(255,255,255,0.6);font-size:{size}px;font-family:'{font}';"
+_LABEL_QSS = "color:rgba(255,255,255,0.8);font-size:{size}px;font-family:'{font}';"
+_BROWSE_BTN_QSS = "background:{background};border:none;border-radius:{radius}px;"
+
+# 页面级样式表：各类控件按对象名匹配，整页只需解析一次样式表
+# （首条规则让页面内的图标等标签默认透明，无需各自设置样式表）
+_PAGE_QSS = (
+    "*{{background:transparent;}}"
+    "QLabel#settingsTitle{{{title}}}"
+    "QLabel#settingsItemTitle{{{item_title}}}"
+    "QLabel#settingsDesc{{{desc}}}"
+    "QLabel#settingsLabel{{{label}}}"
+    "QWidget#settingsMenu{{background:rgba(255,255,255,0.08);border-radius:8px;}}"
+    "QWidget#settingsOption{{background:rgba(255,255,255,0.08);border-radius:{radius}px;}}"
+    "QWidget#settingsSectionBody{{background:rgba(255,255,255,0);"
+    "border-bottom-left-radius:{radius}px;border-bottom-right-radius:{radius}px;}}"
+    "QPushButton#settingsMenuHeader{{background:transparent;border:none;"
+    "border-top-left-radius:{radius}px;border-top-right-radius:{radius}px;}}"
+    "QPushButton#settingsMenuHeader:hover{{background:rgba(255,255,255,0.05);}}"
+    "QPushButton#settingsMenuHeader:pressed{{background:rgba(255,255,255,0.02);}}"
+    "QPushButton#settingsCard{{background:rgba(255,255,255,0.05);border:none;border-radius:0px;}}"
+    "QPushButton#settingsCard[selected=\"true\"]{{background:rgba(255,255,255,0.15);}}"
+    "QPushButton#settingsCard:hover{{background:rgba(255,255,255,0.1);}}"
+    "QPushButton#settingsCard:pressed{{background:rgba(255,255,255,0.05);}}"
+)
+
+# 字体下拉框样式表
+_COMBO_QSS = (
+    "QComboBox{{"
+    "background:rgba(0,0,0,0.3);"
+    "border:1px solid rgba(255,255,255,0.15);"
+    "border-radius:{radius}px;"
+    "padding:{padding}px;"
+    "color:rgba(255,255,255,0.95);"
+    "font-size:{fs}px;"
+    "font-family:{font};"
+    "}}"
+    "QComboBox:hover{{"
+    "background:rgba(0,0,0,0.4);"
+    "border:1px solid rgba(255,255,255,0.25);"
+    "}}"
+    "QComboBox:focus{{"
+    "background:rgba(0,0,0,0.5);"
+    "border:1px solid rgba(100,150,255,0.6);"
+    "}}"
+    "QComboBox::drop-down{{"
+    "border:none;"
+    "width:28px;"
+    "background:transparent;"
+    "}}"
+    "QComboBox QAbstractItemView{{"
+    "background:rgba(0,0,0,{dropdown_alpha:.2f});"
+    "border:1px solid rgba(255,255,255,0.1);"
+    "border-radius:{radius}px;"
+    "selection-background-color:rgba(255,255,255,0.15);"
+    "selection-color:white;"
+    "outline:none;"
+    "padding:{view_pad}px;"
+    "}}"
+    "QComboBox QAbstractItemView::item{{"
+    "height:{item_h}px;"
+    "padding:{item_pad_v}px {item_pad_h}px;"
+    "color:rgba(255,255,255,0.85);"
+    "border-radius:{item_radius}px;"
+    "font-family:{font};"
+    "}}"
+    "QComboBox QScrollBar:vertical{{"
+    "background:rgba(255,255,255,0.05);"
+    "width:8px;"
+    "margin:0px;"
+    "border-radius:4px;"
+    "}}"
+    "QComboBox QScrollBar::handle:vertical{{"
+    "background:rgba(255,255,255,0.3);"
+    "min-height:20px;"
+    "border-radius:4px;"
+    "}}"
+)
+
+
+@lru_cache(maxsize=64)
+def _color_to_hex(color_str):
+    """解析颜色字符串并返回十六进制格式（结果按输入缓存）"""
+    color = QColor(color_str)
+    if color.isValid():
+        return color.name(QColor.NameFormat.HexArgb)
+    if len(color_str) == 7 and color_str.startswith('#'):
+        return QColor(f"#FF{color_str[1:]}").name(QColor.NameFormat.HexArgb)
+    return "#00000000"
+
 
 class SettingsPageBuilder:
     """设置页面构建器"""
 
+    # 排好序的系统字体列表（常用字体在前），首次创建字体下拉框时获取
+    _FONT_FAMILIES = None
+    # 字体下拉框样式表：(DPI缩放, 下拉列表透明度, 字体) -> 样式表
+    _COMBO_QSS_CACHE = {}
+    # 格式化后的页面样式表：(DPI缩放, 字体) -> {名称: 样式表}，重建页面时直接复用
+    _QSS_CACHE = {}
+
     def __init__(self, builder):
         self.builder = builder
+        # 常用尺寸按DPI预先缩放
+        self._s = {n: builder._scale_size(n) for n in _SCALED_SIZES}
+        # 格式化后的样式表及其对应的字体
+        self._qss = {}
+        self._qss_font = None
+        # 设置页面及其当前使用的页面样式表
+        self._page = None
+        self._page_qss = None
+        # 尚未构建内容的可展开菜单：content_attr -> 构建函数
+        self._pending_sections = {}
 
     def create_config_page(self):
         """创建设置页面"""
-        from PyQt6.QtWidgets import QScrollArea
-
+        window = self.builder.window
         page = QWidget()
-        page.setStyleSheet("background:transparent;")
+        self._page = page
+        self.update_font()
         pl = QVBoxLayout(page)
         pl.setContentsMargins(
-            self.builder._scale_size(20), self.builder._scale_size(10),
-            self.builder._scale_size(20), self.builder._scale_size(20)
+            self._s[20], self._s[10],
+            self._s[20], self._s[20]
         )
-        pl.setSpacing(self.builder._scale_size(15))
+        pl.setSpacing(self._s[15])
 
         title = QLabel()
-        title.setStyleSheet(
-            f"color:white;font-size:{self.builder._scale_size(20)}px;"
-            f"font-family:'{self.builder._get_font_family()}';font-weight:bold;"
-        )
+        title.setObjectName("settingsTitle")
         self.builder.text_renderer.register_widget(title, "page_settings", group="settings_page")
-        title.setStyleSheet(
-            f"color:white;font-size:{self.builder._scale_size(20)}px;"
-            f"font-family:'{self.builder._get_font_family()}';font-weight:bold;"
-        )
         pl.addWidget(title)
 
         # 创建滚动区域
@@ -51,197 +169,260 @@ class SettingsPageBuilder:
 
         # 滚动内容区域
         scroll_content = QWidget()
-        scroll_content.setStyleSheet("background: transparent;")
         scroll_layout = QVBoxLayout(scroll_content)
         scroll_layout.setContentsMargins(0, 0, 0, 0)
-        scroll_layout.setSpacing(self.builder._scale_size(15))
-        scroll_layout.addStretch()
+        scroll_layout.setSpacing(self._s[15])
 
-        scroll_area.setWidget(scroll_content)
-        pl.addWidget(scroll_area, 1)
+        # 构建期间暂停重绘，构建完成后统一更新一次
+        page.setUpdatesEnabled(False)
+        scroll_content.setUpdatesEnabled(False)
 
+        # 外观、语言、字体设置的内容在首次展开时才构建
         # 外观设置容器
-        self.builder.window.appearance_container = self._create_expandable_menu(
+        window.appearance_container = self._create_expandable_menu(
             "settings_appearance",
             "settings_appearance_desc",
             "svg/palette.svg", "svg/palette-fill.svg",
-            content_attr="appearance"
+            content_attr="appearance",
+            content_builder=self._build_appearance_content
+        )
+        scroll_layout.addWidget(window.appearance_container)
+
+        window.appearance_content = window.appearance_container.layout().itemAt(1).widget()
+        window.appearance_content.setVisible(False)
+
+        # 语言设置容器
+        window.language_container = self._create_expandable_menu(
+            "settings_language",
+            "settings_language_desc",
+            "svg/translate.svg", "svg/file-earmark-font.svg",
+            toggle_handler=window.toggle_language_menu,
+            content_attr="language",
+            content_builder=self._create_language_card
         )
-        scroll_layout.insertWidget(scroll_layout.count() - 1, self.builder.window.appearance_container)
+        scroll_layout.addWidget(window.language_container)
+
+        window.language_content = window.language_container.layout().itemAt(1).widget()
+        window.language_content.setVisible(False)
+
+        # 字体设置容器
+        window.font_container = self._create_expandable_menu(
+            "settings_font",
+            "settings_font_desc",
+            "svg/type.svg", "svg/file-earmark-font.svg",
+            toggle_handler=window.toggle_font_menu,
+            content_attr="font",
+            content_builder=self._build_font_content
+        )
+        scroll_layout.addWidget(window.font_container)
+
+        window.font_content = window.font_container.layout().itemAt(1).widget()
+        window.font_content.setVisible(False)
+
+        # 版本隔离选项
+        self._create_version_isolation_option()
+        scroll_layout.addWidget(window.version_isolation_widget)
+
+        # 开发控制台选项
+        self._create_dev_console_option()
+        scroll_layout.addWidget(window.dev_console_widget)
+        scroll_layout.addStretch()
+
+        # 内容构建完成后再放入滚动区域，避免每次添加都触发滚动区域重新布局
+        scroll_area.setWidget(scroll_content)
+        pl.addWidget(scroll_area, 1)
+
+        scroll_content.setUpdatesEnabled(True)
+        page.setUpdatesEnabled(True)
 
-        self.builder.window.appearance_content = self.builder.window.appearance_container.layout().itemAt(1).widget()
+        return page
 
-        # 纯色背景卡片
-        self.builder.window.solid_card = self._create_bg_card(
+    def _build_appearance_content(self):
+        """构建外观设置菜单的内容"""
+        window = self.builder.window
+        cfg = window.config
+        bg = cfg.get("background_mode")
+        blur_opacity = cfg.get("blur_opacity", 150)
+
+        # 纯色背景卡片（旧版的 blur 模式按纯色处理）
+        window.solid_card = self._create_bg_card(
             "background_solid",
             "background_solid_desc",
-            self.builder.window.config.get("background_mode") == "blur" or self.builder.window.config.get("background_mode") == "solid",
-            lambda: self.builder.window.set_background("solid")
+            bg in ("solid", "blur"),
+            lambda: window.set_background("solid")
         )
-        self.builder.window.appearance_content_layout.addWidget(self.builder.window.solid_card)
+        window.appearance_content_layout.addWidget(window.solid_card)
 
         # 颜色选择区域
-        self._create_color_picker()
-        self.builder.window.appearance_content_layout.addWidget(self.builder.window.color_widget)
+        self._create_color_picker(bg == "solid")
+        window.appearance_content_layout.addWidget(window.color_widget)
 
         # 不透明度滑块
-        self._create_opacity_slider()
-        self.builder.window.appearance_content_layout.addWidget(self.builder.window.opacity_widget)
+        self._create_opacity_slider(blur_opacity, bg == "solid")
+        window.appearance_content_layout.addWidget(window.opacity_widget)
 
         # 图片背景卡片
-        self.builder.window.image_card = self._create_bg_card(
+        window.image_card = self._create_bg_card(
             "background_image",
             "background_image_desc",
-            self.builder.window.config.get("background_mode") == "image",
-            lambda: self.builder.window.set_background("image")
+            bg == "image",
+            lambda: window.set_background("image")
         )
-        self.builder.window.appearance_content_layout.addWidget(self.builder.window.image_card)
+        window.appearance_content_layout.addWidget(window.image_card)
 
         # 路径输入区域
-        self._create_path_input()
-        self.builder.window.appearance_content_layout.addWidget(self.builder.window.path_widget)
-
-        # 背景模糊开关
-        self._create_blur_toggle_option()
-        self.builder.window.appearance_content_layout.addWidget(self.builder.window.blur_toggle_widget)
-
-        self.builder.window.appearance_content.setVisible(False)
-
-        # 语言设置容器
-        self.builder.window.language_container = self._create_expandable_menu(
-            "settings_language",
-            "settings_language_desc",
-            "svg/translate.svg", "svg/file-earmark-font.svg",
-            toggle_handler=self.builder.window.toggle_language_menu,
-            content_attr="language"
-        )
-        scroll_layout.insertWidget(scroll_layout.count() - 1, self.builder.window.language_container)
+        self._create_path_input(bg == "image")
+        window.appearance_content_layout.addWidget(window.path_widget)
 
-        self.builder.window.language_content = self.builder.window.language_container.layout().itemAt(1).widget()
+        # 背景模糊开关只在纯色背景模式下显示，其他模式下等首次切换到纯色背景时再构建
+        if bg == "solid":
+            self.ensure_blur_toggle_option()
 
-        # 语言卡片
-        self._create_language_card()
-
-        self.builder.window.language_content.setVisible(False)
-
-        # 字体设置容器
-        self.builder.window.font_container = self._create_expandable_menu(
-            "settings_font",
-            "settings_font_desc",
-            "svg/type.svg", "svg/file-earmark-font.svg",
-            toggle_handler=self.builder.window.toggle_font_menu,
-            content_attr="font"
-        )
-        scroll_layout.insertWidget(scroll_layout.count() - 1, self.builder.window.font_container)
-
-        self.builder.window.font_content = self.builder.window.font_container.layout().itemAt(1).widget()
+    def _build_font_content(self):
+        """构建字体设置菜单的内容"""
+        window = self.builder.window
+        cfg = window.config
+        font_mode = cfg.get("font_mode")
 
         # 选择字体卡片
-        self.builder.window.font_select_card = self._create_bg_card(
+        window.font_select_card = self._create_bg_card(
             "font_select",
             "font_select_desc",
-            self.builder.window.config.get("font_mode") == 0,
-            lambda: self.builder.window.set_font_mode(0)
+            font_mode == 0,
+            lambda: window.set_font_mode(0)
         )
-        self.builder.window.font_content_layout.addWidget(self.builder.window.font_select_card)
+        window.font_content_layout.addWidget(window.font_select_card)
 
         # 字体选择下拉框区域
-        self._create_font_select_widget()
-        self.builder.window.font_content_layout.addWidget(self.builder.window.font_select_widget)
+        self._create_font_select_widget(cfg.get("blur_opacity", 150))
+        window.font_content_layout.addWidget(window.font_select_widget)
 
         # 自定义字体卡片
-        self.builder.window.font_custom_card = self._create_bg_card(
+        window.font_custom_card = self._create_bg_card(
             "font_custom",
             "font_custom_desc",
-            self.builder.window.config.get("font_mode") == 1,
-            lambda: self.builder.window.set_font_mode(1)
+            font_mode == 1,
+            lambda: window.set_font_mode(1)
         )
-        self.builder.window.font_content_layout.addWidget(self.builder.window.font_custom_card)
+        window.font_content_layout.addWidget(window.font_custom_card)
 
         # 自定义字体路径输入区域
-        self._create_font_path_widget()
-        self.builder.window.font_content_layout.addWidget(self.builder.window.font_path_widget)
-
-        self.builder.window.font_content.setVisible(False)
-
-        # 版本隔离选项
-        self._create_version_isolation_option()
-        scroll_layout.insertWidget(scroll_layout.count() - 1, self.builder.window.version_isolation_widget)
-
-        # 开发控制台选项
-        self._create_dev_console_option()
-        scroll_layout.insertWidget(scroll_layout.count() - 1, self.builder.window.dev_console_widget)
-
-        return page
+        self._create_font_path_widget(font_mode == 1)
+        window.font_content_layout.addWidget(window.font_path_widget)
+
+    def _ensure_section_built(self, content_attr):
+        """首次展开菜单时构建其内容"""
+        content_builder = self._pending_sections.pop(content_attr, None)
+        if content_builder is not None:
+            content_builder()
+
+    def _apply_row_margins(self, layout, left, top=12, right=15, bottom=12, spacing=12):
+        """按预先缩放的尺寸设置行布局的边距和间距"""
+        s = self._s
+        layout.setContentsMargins(s[left], s[top], s[right], s[bottom])
+        layout.setSpacing(s[spacing])
+
+    def _get_qss(self, name):
+        """获取格式化后的样式表（字体变化时才重新格式化）"""
+        font_family = self.builder._get_font_family()
+        if font_family != self._qss_font:
+            key = (self.builder.dpi_scale, font_family)
+            qss = self._QSS_CACHE.get(key)
+            if qss is None:
+                qss = self._format_qss(font_family)
+                self._QSS_CACHE[key] = qss
+            self._qss = qss
+            self._qss_font = font_family
+        return self._qss[name]
+
+    def _format_qss(self, font_family):
+        """按当前DPI和指定字体格式化全部样式表"""
+        radius = self._s[8]
+        qss = {
+            "browse_normal": _BROWSE_BTN_QSS.format(background="rgba(255,255,255,0.1)", radius=radius),
+            "browse_hover": _BROWSE_BTN_QSS.format(background="rgba(255,255,255,0.15)", radius=radius),
+        }
+        qss["page"] = _PAGE_QSS.format(
+            title=_TITLE_QSS.format(size=self._s[20], font=font_family),
+            item_title=_ITEM_TITLE_QSS.format(size=self._s[14], font=font_family),
+            desc=_DESC_QSS.format(size=self._s[12], font=font_family),
+            label=_LABEL_QSS.format(size=self._s[13], font=font_family),
+            radius=radius,
+        )
+        return qss
+
+    def update_font(self):
+        """字体变化后更新页面样式表（未变化时不重新设置，避免整页重新应用样式）"""
+        if self._page is None:
+            return
+        page_qss = self._get_qss("page")
+        if page_qss is not self._page_qss:
+            self._page.setStyleSheet(page_qss)
+            self._page_qss = page_qss
+
+    def set_card_selected(self, card, selected):
+        """切换背景、字体卡片的选中样式和勾选图标"""
+        card.setProperty("selected", selected)
+        card.style().unpolish(card)
+        card.style().polish(card)
+        card.check_label.setVisible(selected)
 
     def _create_expandable_menu(self, title_key, desc_key, icon_path=None, icon_path_active=None,
-                                  toggle_handler=None, content_attr="appearance"):
-        """创建可展开菜单"""
+                                  toggle_handler=None, content_attr="appearance", content_builder=None):
+        """创建可展开菜单
+
+        content_builder 用于延迟构建菜单内容，在首次点击标题栏、展开菜单之前调用
+        """
+        window = self.builder.window
         container = QWidget()
-        container.setStyleSheet("background:rgba(255,255,255,0.08);border-radius:8px;")
+        container.setObjectName("settingsMenu")
         main_layout = QVBoxLayout(container)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
 
-        from widgets import CardButton
-        from utils import load_svg_icon, scale_icon_for_display
-
         header = CardButton()
-        header.setFixedHeight(self.builder._scale_size(70))
+        header.setFixedHeight(self._s[70])
         header.setCursor(Qt.CursorShape.PointingHandCursor)
+        # 构建内容的槽需先于展开的槽连接，保证展开时内容已存在
+        if content_builder is not None:
+            self._pending_sections[content_attr] = content_builder
+            header.clicked.connect(lambda: self._ensure_section_built(content_attr))
         if toggle_handler:
             header.clicked.connect(toggle_handler)
         else:
-            header.clicked.connect(self.builder.window.toggle_appearance_menu)
-
-        border_radius = self.builder._scale_size(8)
-        header.setStyleSheet(
-            f"QPushButton{{background:transparent;border:none;"
-            f"border-top-left-radius:{border_radius}px;border-top-right-radius:{border_radius}px;}}"
-            f"QPushButton:hover{{background:rgba(255,255,255,0.05);}}"
-            f"QPushButton:pressed{{background:rgba(255,255,255,0.02);}}"
-        )
+            header.clicked.connect(window.toggle_appearance_menu)
+
+        header.setObjectName("settingsMenuHeader")
 
         header_layout = QHBoxLayout(header)
-        header_layout.setContentsMargins(
-            self.builder._scale_size(15), self.builder._scale_size(12),
-            self.builder._scale_size(15), self.builder._scale_size(12)
-        )
-        header_layout.setSpacing(self.builder._scale_size(12))
+        self._apply_row_margins(header_layout, 15)
 
         icon_label = None
         if icon_path:
             icon_label = QLabel()
-            icon_label.setFixedSize(self.builder._scale_size(20), self.builder._scale_size(20))
+            icon_label.setFixedSize(self._s[20], self._s[20])
             icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            icon_label.setStyleSheet("background:transparent;")
             icon_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
             icon_label.setObjectName("menu_icon")
 
-            icon_pixmap = load_svg_icon(icon_path, self.builder.dpi_scale)
+            icon_pixmap = load_display_icon(icon_path, 20, self.builder.dpi_scale)
             if icon_pixmap:
-                icon_label.setPixmap(scale_icon_for_display(icon_pixmap, 20, self.builder.dpi_scale))
+                icon_label.setPixmap(icon_pixmap)
 
             header_layout.addWidget(icon_label, 0, Qt.AlignmentFlag.AlignTop)
 
         text_layout = QVBoxLayout()
-        text_layout.setSpacing(self.builder._scale_size(4))
+        text_layout.setSpacing(self._s[4])
         text_layout.setContentsMargins(0, 0, 0, 0)
 
         title_lbl = QLabel()
-        title_lbl.setStyleSheet(
-            f"color:white;font-size:{self.builder._scale_size(14)}px;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
+        title_lbl.setObjectName("settingsItemTitle")
         title_lbl.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         text_layout.addWidget(title_lbl)
         self.builder.text_renderer.register_widget(title_lbl, title_key, group="settings_page")
 
         desc_lbl = QLabel()
-        desc_lbl.setStyleSheet(
-            f"color:rgba(255,255,255,0.6);font-size:{self.builder._scale_size(12)}px;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
+        desc_lbl.setObjectName("settingsDesc")
         desc_lbl.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         text_layout.addWidget(desc_lbl)
         self.builder.text_renderer.register_widget(desc_lbl, desc_key, group="settings_page")
@@ -256,72 +437,57 @@ class SettingsPageBuilder:
         content_layout.setSpacing(0)
         content_widget = QWidget()
         content_widget.setLayout(content_layout)
-        content_widget.setStyleSheet("background:transparent;")
 
         main_layout.addWidget(content_widget)
 
-        setattr(self.builder.window, f"{content_attr}_content_layout", content_layout)
-        setattr(self.builder.window, f"{content_attr}_icon_path", icon_path)
-        setattr(self.builder.window, f"{content_attr}_icon_path_active", icon_path_active)
-        setattr(self.builder.window, f"{content_attr}_icon_label", icon_label)
+        setattr(window, f"{content_attr}_content_layout", content_layout)
+        setattr(window, f"{content_attr}_icon_path", icon_path)
+        setattr(window, f"{content_attr}_icon_path_active", icon_path_active)
+        setattr(window, f"{content_attr}_icon_label", icon_label)
 
         return container
 
     def _create_bg_card(self, title_key, desc_key, selected, handler):
         """创建背景卡片"""
-        from widgets import CardButton
-
         card = CardButton()
-        card.setFixedHeight(self.builder._scale_size(70))
+        card.setFixedHeight(self._s[70])
         card.setCursor(Qt.CursorShape.PointingHandCursor)
         card.clicked.connect(handler)
 
-        style = "background:rgba(255,255,255,0.15);" if selected else "background:rgba(255,255,255,0.05);"
-        card.setStyleSheet(
-            f"QPushButton{{{style}border:none;border-radius:0px;}}"
-            f"QPushButton:hover{{background:rgba(255,255,255,0.1);}}"
-            f"QPushButton:pressed{{background:rgba(255,255,255,0.05);}}"
-        )
+        card.setObjectName("settingsCard")
+        card.setProperty("selected", selected)
 
         layout = QHBoxLayout(card)
-        layout.setContentsMargins(
-            self.builder._scale_size(15), self.builder._scale_size(12),
-            self.builder._scale_size(15), self.builder._scale_size(12)
-        )
-        layout.setSpacing(self.builder._scale_size(12))
+        self._apply_row_margins(layout, 15)
 
         check_label = QLabel()
-        check_label.setFixedSize(self.builder._scale_size(20), self.builder._scale_size(20))
+        check_label.setFixedSize(self._s[20], self._s[20])
         check_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        check_label.setStyleSheet("background:transparent;")
         check_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
 
-        if selected:
-            from utils import load_svg_icon, scale_icon_for_display
-            check_pixmap = load_svg_icon("svg/check-lg.svg", self.builder.dpi_scale)
-            if check_pixmap:
-                check_label.setPixmap(scale_icon_for_display(check_pixmap, 20, self.builder.dpi_scale))
+        # 勾选图标始终设置，选中状态只切换显隐（隐藏时保留占位，文字位置不变）
+        check_pixmap = load_display_icon("svg/check-lg.svg", 20, self.builder.dpi_scale)
+        if check_pixmap:
+            check_label.setPixmap(check_pixmap)
+        size_policy = check_label.sizePolicy()
+        size_policy.setRetainSizeWhenHidden(True)
+        check_label.setSizePolicy(size_policy)
 
         layout.addWidget(check_label, 0, Qt.AlignmentFlag.AlignTop)
+        check_label.setVisible(selected)
 
         text_layout = QVBoxLayout()
-        text_layout.setSpacing(self.builder._scale_size(4))
+        text_layout.setSpacing(self._s[4])
         text_layout.setContentsMargins(0, 0, 0, 0)
 
         title_lbl = QLabel()
-        title_lbl.setStyleSheet(
-            f"color:white;font-size:{self.builder._scale_size(14)}px;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
+        title_lbl.setObjectName("settingsItemTitle")
         title_lbl.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         text_layout.addWidget(title_lbl)
         self.builder.text_renderer.register_widget(title_lbl, title_key, group="settings_page")
 
         desc_lbl = QLabel()
-        desc_lbl.setStyleSheet(
-            f"color:rgba(255,255,255,0.6);font-size:{self.builder._scale_size(12)}px;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
+        desc_lbl.setObjectName("settingsDesc")
         desc_lbl.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         text_layout.addWidget(desc_lbl)
         self.builder.text_renderer.register_widget(desc_lbl, desc_key, group="settings_page")
@@ -332,309 +498,197 @@ class SettingsPageBuilder:
         card.check_label = check_label
         return card
 
-    def _create_opacity_slider(self):
+    def _create_opacity_slider(self, blur_opacity, visible):
         """创建不透明度滑块"""
-        self.builder.window.opacity_widget = QWidget()
-        border_radius = self.builder._scale_size(8)
-        self.builder.window.opacity_widget.setStyleSheet(
-            f"background:rgba(255,255,255,0);"
-            f"border-bottom-left-radius:{border_radius}px;border-bottom-right-radius:{border_radius}px;"
-        )
-        opacity_layout = QVBoxLayout(self.builder.window.opacity_widget)
-        opacity_layout.setContentsMargins(
-            self.builder._scale_size(50), self.builder._scale_size(8),
-            self.builder._scale_size(15), self.builder._scale_size(8)
-        )
-        opacity_layout.setSpacing(self.builder._scale_size(4))
+        window = self.builder.window
+        window.opacity_widget = QWidget()
+        window.opacity_widget.setObjectName("settingsSectionBody")
+        opacity_layout = QVBoxLayout(window.opacity_widget)
+        self._apply_row_margins(opacity_layout, 50, top=8, bottom=8, spacing=4)
 
         opacity_header_layout = QHBoxLayout()
         opacity_label = QLabel()
-        opacity_label.setStyleSheet(
-            f"color:rgba(255,255,255,0.8);font-size:{self.builder._scale_size(13)}px;"
-            f"font-family:'{self.builder._get_font_family()}';"
-        )
+        opacity_label.setObjectName("settingsLabel")
         self.builder.text_renderer.register_widget(opacity_label, "opacity", group="settings_page")
-        opacity_label.setStyleSheet(
-            f"color:rgba(255,255,255,0.8);font-size:{self.builder._scale_size(13)}px;"
-            f"font-family:'{self.builder._get_font_family()}';"
-        )
 
         opacity_value = QLabel()
         # 统一的百分比计算：10-255 映射到 0%-100%
-        opacity_percent = int((self.builder.window.config.get("blur_opacity", 150) - 10) / (255 - 10) * 100)
+        opacity_percent = int((blur_opacity - 10) / (255 - 10) * 100)
         opacity_value.setText(str(opacity_percent) + "%")
-        opacity_value.setStyleSheet(
-            f"color:rgba(255,255,255,0.8);font-size:{self.builder._scale_size(13)}px;"
-            f"font-family:'{self.builder._get_font_family()}';"
-        )
-        self.builder.window.opacity_value_label = opacity_value
+        opacity_value.setObjectName("settingsLabel")
+        window.opacity_value_label = opacity_value
 
         opacity_header_layout.addWidget(opacity_label)
         opacity_header_layout.addStretch()
         opacity_header_layout.addWidget(opacity_value)
         opacity_layout.addLayout(opacity_header_layout)
 
-        self.builder.text_renderer.register_widget(opacity_label, "opacity", group="settings_page")
+        window.opacity_slider = QSlider(Qt.Orientation.Horizontal)
+        window.opacity_slider.setRange(10, 255)
+        window.opacity_slider.setValue(blur_opacity)
 
-        from PyQt6.QtWidgets import QSlider
-        self.builder.window.opacity_slider = QSlider(Qt.Orientation.Horizontal)
-        self.builder.window.opacity_slider.setRange(10, 255)
-        self.builder.window.opacity_slider.setValue(self.builder.window.config.get("blur_opacity", 150))
+        window.opacity_slider.setStyleSheet(SLIDER_STYLE)
 
-        from styles import SLIDER_STYLE
-        self.builder.window.opacity_slider.setStyleSheet(SLIDER_STYLE)
+        window.opacity_slider.valueChanged.connect(window.on_opacity_preview)
+        window.opacity_slider.sliderReleased.connect(window.on_opacity_released)
 
-        self.builder.window.opacity_slider.valueChanged.connect(self.builder.window.on_opacity_preview)
-        self.builder.window.opacity_slider.sliderReleased.connect(self.builder.window.on_opacity_released)
-
-        opacity_layout.addWidget(self.builder.window.opacity_slider)
+        opacity_layout.addWidget(window.opacity_slider)
 
         # 不透明度滑块只在纯色背景模式下显示
-        self.builder.window.opacity_widget.setVisible(self.builder.window.config.get("background_mode") == "solid")
+        window.opacity_widget.setVisible(visible)
 
-    def _create_path_input(self):
+    def _create_path_input(self, visible):
         """创建路径输入区域"""
-        self.builder.window.path_widget = QWidget()
-        border_radius = self.builder._scale_size(8)
-        self.builder.window.path_widget.setStyleSheet(
-            f"background:rgba(255,255,255,0);"
-            f"border-bottom-left-radius:{border_radius}px;border-bottom-right-radius:{border_radius}px;"
-        )
-        path_layout = QHBoxLayout(self.builder.window.path_widget)
-        path_layout.setContentsMargins(
-            self.builder._scale_size(35), self.builder._scale_size(12),
-            self.builder._scale_size(15), self.builder._scale_size(12)
-        )
-        path_layout.setSpacing(self.builder._scale_size(10))
+        window = self.builder.window
+        window.path_widget = QWidget()
+        window.path_widget.setObjectName("settingsSectionBody")
+        path_layout = QHBoxLayout(window.path_widget)
+        self._apply_row_margins(path_layout, 35, spacing=10)
 
         path_label = self.builder._create_label_with_style("bg_image_path")
         path_layout.addWidget(path_label)
 
         self.builder.text_renderer.register_widget(path_label, "bg_image_path", group="settings_page")
 
-        self.builder.window.path_input = QLineEdit()
-        self.builder.window.path_input.setText(self.builder.window.config.get("background_image_path", ""))
-        self.builder.window.path_input.setStyleSheet(self.builder._get_lineedit_stylesheet())
-        self.builder.window.path_input.editingFinished.connect(self.builder.window.on_path_changed)
-        path_layout.addWidget(self.builder.window.path_input, 1)
+        window.path_input = QLineEdit()
+        window.path_input.setText(window.config.get("background_image_path", ""))
+        window.path_input.setStyleSheet(self.builder._get_lineedit_stylesheet())
+        window.path_input.editingFinished.connect(window.on_path_changed)
+        path_layout.addWidget(window.path_input, 1)
 
         # 浏览按钮
-        from widgets import ClickableLabel
-        from utils import load_svg_icon, scale_icon_for_display
         browse_btn = ClickableLabel()
-        browse_btn.setFixedSize(self.builder._scale_size(32), self.builder._scale_size(32))
-        browse_btn.setHoverStyle(
-            f"background:rgba(255,255,255,0.1);border:none;border-radius:{border_radius}px;",
-            f"background:rgba(255,255,255,0.15);border:none;border-radius:{border_radius}px;"
-        )
+        browse_btn.setFixedSize(self._s[32], self._s[32])
+        browse_btn.setHoverStyle(self._get_qss("browse_normal"), self._get_qss("browse_hover"))
         browse_btn.setAlignment(Qt.AlignmentFlag.AlignCenter)
         browse_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        browse_btn.setCallback(self.builder.window.choose_background_image)
-        folder_pixmap = load_svg_icon("svg/folder2.svg", self.builder.dpi_scale)
+        browse_btn.setCallback(window.choose_background_image)
+        folder_pixmap = load_display_icon("svg/folder2.svg", 20, self.builder.dpi_scale)
         if folder_pixmap:
-            browse_btn.setPixmap(scale_icon_for_display(folder_pixmap, 20, self.builder.dpi_scale))
+            browse_btn.setPixmap(folder_pixmap)
         path_layout.addWidget(browse_btn)
 
-        self.builder.window.path_widget.setVisible(self.builder.window.config.get("background_mode") == "image")
+        window.path_widget.setVisible(visible)
 
-    def _create_color_picker(self):
+    def _create_color_picker(self, visible):
         """创建颜色选择器"""
-        from PyQt6.QtCore import QSize
-
-        self.builder.window.color_widget = QWidget()
-        border_radius = self.builder._scale_size(8)
-        self.builder.window.color_widget.setStyleSheet(
-            f"background:rgba(255,255,255,0);"
-            f"border-bottom-left-radius:{border_radius}px;border-bottom-right-radius:{border_radius}px;"
-        )
-        color_layout = QHBoxLayout(self.builder.window.color_widget)
-        color_layout.setContentsMargins(
-            self.builder._scale_size(50), self.builder._scale_size(12),
-            self.builder._scale_size(15), self.builder._scale_size(12)
-        )
-        color_layout.setSpacing(self.builder._scale_size(10))
+        window = self.builder.window
+        window.color_widget = QWidget()
+        window.color_widget.setObjectName("settingsSectionBody")
+        color_layout = QHBoxLayout(window.color_widget)
+        self._apply_row_margins(color_layout, 50, spacing=10)
 
         color_label = self.builder._create_label_with_style("bg_color")
         color_layout.addWidget(color_label)
 
         self.builder.text_renderer.register_widget(color_label, "bg_color", group="settings_page")
 
-        self.builder.window.color_input = QLineEdit()
-        self.builder.window.color_input.setText(self.builder.window.config.get("background_color", "#00000000"))
-        self.builder.window.color_input.setStyleSheet(self.builder._get_lineedit_stylesheet())
-        self.builder.window.color_input.editingFinished.connect(self.builder.window.on_color_changed)
-        color_layout.addWidget(self.builder.window.color_input, 1)
+        window.color_input = QLineEdit()
+        color_str = window.config.get("background_color", "#00000000")
+        window.color_input.setText(color_str)
+        window.color_input.setStyleSheet(self.builder._get_lineedit_stylesheet())
+        window.color_input.editingFinished.connect(window.on_color_changed)
+        color_layout.addWidget(window.color_input, 1)
 
         # 颜色选择按钮
-        from PyQt6.QtGui import QColor
         color_btn = QPushButton()
-        color_btn.setFixedSize(self.builder._scale_size(32), self.builder._scale_size(32))
-        border_radius_btn = self.builder._scale_size(4)
-        color_str = self.builder.window.config.get("background_color", "#00000000")
+        color_btn.setFixedSize(self._s[32], self._s[32])
+        border_radius_btn = self._s[4]
         bg_color = self._parse_color_to_hex(color_str)
         color_btn.setStyleSheet(
             f"QPushButton{{background:{bg_color};border:1px solid rgba(255,255,255,0.3);"
             f"border-radius:{border_radius_btn}px;}}"
             f"QPushButton:hover{{background:{bg_color};border:1px solid rgba(255,255,255,0.5);}}"
         )
-        color_btn.clicked.connect(self.builder.window.choose_background_color)
+        color_btn.clicked.connect(window.choose_background_color)
         color_layout.addWidget(color_btn)
-        self.builder.window.color_btn = color_btn
+        window.color_btn = color_btn
 
-        self.builder.window.color_widget.setVisible(self.builder.window.config.get("background_mode") == "solid")
+        window.color_widget.setVisible(visible)
 
     def _parse_color_to_hex(self, color_str):
         """解析颜色字符串并返回十六进制格式"""
-        from PyQt6.QtGui import QColor
-        color = QColor(color_str)
-        if color.isValid():
-            return color.name(QColor.NameFormat.HexArgb)
-        if len(color_str) == 7 and color_str.startswith('#'):
-            return QColor(f"#FF{color_str[1:]}").name(QColor.NameFormat.HexArgb)
-        return "#00000000"
-
-    def _create_font_select_widget(self):
-        """创建字体选择部件"""
-        from PyQt6.QtGui import QFontDatabase
+        return _color_to_hex(color_str)
 
-        self.builder.window.font_select_widget = QWidget()
-        border_radius = self.builder._scale_size(8)
-        self.builder.window.font_select_widget.setStyleSheet(
-            f"background:rgba(255,255,255,0);"
-            f"border-bottom-left-radius:{border_radius}px;border-bottom-right-radius:{border_radius}px;"
-        )
-        font_select_layout = QHBoxLayout(self.builder.window.font_select_widget)
-        font_select_layout.setContentsMargins(
-            self.builder._scale_size(35), self.builder._scale_size(12),
-            self.builder._scale_size(15), self.builder._scale_size(12)
-        )
-        font_select_layout.setSpacing(self.builder._scale_size(10))
+    def _create_font_select_widget(self, blur_opacity):
+        """创建字体选择部件"""
+        window = self.builder.window
+        window.font_select_widget = QWidget()
+        window.font_select_widget.setObjectName("settingsSectionBody")
+        font_select_layout = QHBoxLayout(window.font_select_widget)
+        self._apply_row_margins(font_select_layout, 35, spacing=10)
 
         font_select_label = QLabel()
-        font_select_label.setStyleSheet(
-            f"color:rgba(255,255,255,0.8);font-size:{self.builder._scale_size(13)}px;"
-            f"font-family:'{self.builder._get_font_family()}';"
-        )
+        font_select_label.setObjectName("settingsLabel")
         font_select_layout.addWidget(font_select_label)
 
         self.builder.text_renderer.register_widget(font_select_label, "font_select_label", group="settings_page")
 
         font_select_layout.addStretch()
 
-        self.builder.window.font_combo = QComboBox()
-        self._setup_font_combobox(self.builder.window.font_combo)
-        font_select_layout.addWidget(self.builder.window.font_combo)
+        window.font_combo = LazyComboBox()
+        self._setup_font_combobox(window.font_combo, blur_opacity)
+        font_select_layout.addWidget(window.font_combo)
 
-        return self.builder.window.font_select_widget
+        return window.font_select_widget
 
-    def _setup_font_combobox(self, combo):
+    def _setup_font_combobox(self, combo, blur_opacity):
         """设置字体下拉框"""
-        from PyQt6.QtGui import QFontDatabase
-
-        combo.setFixedHeight(self.builder._scale_size(32))
-        combo.setFixedWidth(self.builder._scale_size(200))
+        window = self.builder.window
+        combo.setFixedHeight(self._s[32])
+        combo.setFixedWidth(self._s[200])
         combo.setMaxVisibleItems(8)
 
-        padding = self.builder._scale_size(6)
-        border_radius = self.builder._scale_size(4)
-
-        # 获取当前下拉框透明度（主页透明度 + 50）
-        blur_opacity = self.builder.window.config.get("blur_opacity", 150)
+        # 下拉框透明度（主页透明度 + 50）
         dropdown_opacity_value = min(255, blur_opacity + 50)
-        dropdown_opacity_rgba = dropdown_opacity_value / 255.0
-
-        escaped_font = self.builder._get_font_family().replace("\\", "\\\\").replace("'", "\\'").replace('"', '\\"')
-        font_family_quoted = f'"{escaped_font}"'
-
-        combo.setStyleSheet(
-            f"QComboBox{{"
-            f"background:rgba(0,0,0,0.3);"
-            f"border:1px solid rgba(255,255,255,0.15);"
-            f"border-radius:{border_radius}px;"
-            f"padding:{padding}px;"
-            f"color:rgba(255,255,255,0.95);"
-            f"font-size:{self.builder._scale_size(13)}px;"
-            f"font-family:{font_family_quoted};"
-            f"}}"
-            f"QComboBox:hover{{"
-            f"background:rgba(0,0,0,0.4);"
-            f"border:1px solid rgba(255,255,255,0.25);"
-            f"}}"
-            f"QComboBox:focus{{"
-            f"background:rgba(0,0,0,0.5);"
-            f"border:1px solid rgba(100,150,255,0.6);"
-            f"}}"
-            f"QComboBox::drop-down{{"
-            f"border:none;"
-            f"width:28px;"
-            f"background:transparent;"
-            f"}}"
-            f"QComboBox QAbstractItemView{{"
-            f"background:rgba(0,0,0,{dropdown_opacity_rgba:.2f});"
-            f"border:1px solid rgba(255,255,255,0.1);"
-            f"border-radius:{border_radius}px;"
-            f"selection-background-color:rgba(255,255,255,0.15);"
-            f"selection-color:white;"
-            f"outline:none;"
-            f"padding:{self.builder._scale_size(2)}px;"
-            f"}}"
-            f"QComboBox QAbstractItemView::item{{"
-            f"height:{self.builder._scale_size(28)}px;"
-            f"padding:{self.builder._scale_size(6)}px {self.builder._scale_size(8)}px;"
-            f"color:rgba(255,255,255,0.85);"
-            f"border-radius:{border_radius - 1}px;"
-            f"font-family:{font_family_quoted};"
-            f"}}"
-            f"QComboBox QScrollBar:vertical{{"
-            f"background:rgba(255,255,255,0.05);"
-            f"width:8px;"
-            f"margin:0px;"
-            f"border-radius:4px;"
-            f"}}"
-            f"QComboBox QScrollBar::handle:vertical{{"
-            f"background:rgba(255,255,255,0.3);"
-            f"min-height:20px;"
-            f"border-radius:4px;"
-            f"}}"
-        )
-
-        # 获取系统字体
-        font_families = QFontDatabase.families()
-
-        # 添加常用字体到前面
-        common_fonts = ["Microsoft YaHei UI", "SimHei", "Arial", "Segoe UI", "Helvetica"]
-        added_fonts = set()
-
-        for font in common_fonts:
-            if font in font_families:
-                combo.addItem(font)
-                added_fonts.add(font)
-
-        for font in font_families:
-            if font not in added_fonts:
-                combo.addItem(font)
-
-        current_font_family = self.builder.window.config.get("custom_font_family", "Microsoft YaHei UI")
-        font_index = combo.findText(current_font_family)
-        if font_index >= 0:
-            combo.setCurrentIndex(font_index)
-
-        combo.currentTextChanged.connect(self.builder.window.on_font_family_changed)
-
-    def _create_font_path_widget(self):
+        font_family = self.builder._get_font_family()
+
+        key = (self.builder.dpi_scale, dropdown_opacity_value, font_family)
+        combo_qss = self._COMBO_QSS_CACHE.get(key)
+        if combo_qss is None:
+            escaped_font = font_family.replace("\\", "\\\\").replace("'", "\\'").replace('"', '\\"')
+            border_radius = self._s[4]
+            combo_qss = _COMBO_QSS.format(
+                padding=self._s[6],
+                radius=border_radius,
+                item_radius=border_radius - 1,
+                font=f'"{escaped_font}"',
+                fs=self._s[13],
+                dropdown_alpha=dropdown_opacity_value / 255.0,
+                view_pad=self._s[2],
+                item_h=self._s[28],
+                item_pad_v=self._s[6],
+                item_pad_h=self._s[8],
+            )
+            self._COMBO_QSS_CACHE[key] = combo_qss
+        combo.setStyleSheet(combo_qss)
+
+        # 全部字体在首次展开列表时才加入
+        current_font_family = window.config.get("custom_font_family", "Microsoft YaHei UI")
+        combo.setLazyItems(self._get_font_families(), current_font_family)
+
+        combo.currentTextChanged.connect(window.on_font_family_changed)
+
+    @classmethod
+    def _get_font_families(cls):
+        """获取系统字体列表，常用字体排在前面（结果在类上缓存，避免重复枚举系统字体）"""
+        if cls._FONT_FAMILIES is None:
+            font_families = QFontDatabase.families()
+            family_set = frozenset(font_families)
+
+            # 添加常用字体到前面
+            common_fonts = [font for font in _COMMON_FONTS if font in family_set]
+            common_set = set(common_fonts)
+            cls._FONT_FAMILIES = common_fonts + [font for font in font_families if font not in common_set]
+        return cls._FONT_FAMILIES
+
+    def _create_font_path_widget(self, visible):
         """创建字体路径部件"""
-        self.builder.window.font_path_widget = QWidget()
-        border_radius = self.builder._scale_size(8)
-        self.builder.window.font_path_widget.setStyleSheet(
-            f"background:rgba(255,255,255,0);"
-            f"border-bottom-left-radius:{border_radius}px;border-bottom-right-radius:{border_radius}px;"
-        )
-        font_path_layout = QHBoxLayout(self.builder.window.font_path_widget)
-        font_path_layout.setContentsMargins(
-            self.builder._scale_size(35), self.builder._scale_size(12),
-            self.builder._scale_size(15), self.builder._scale_size(12)
-        )
-        font_path_layout.setSpacing(self.builder._scale_size(10))
+        window = self.builder.window
+        window.font_path_widget = QWidget()
+        window.font_path_widget.setObjectName("settingsSectionBody")
+        font_path_layout = QHBoxLayout(window.font_path_widget)
+        self._apply_row_margins(font_path_layout, 35, spacing=10)
 
         font_path_label = self.builder._create_label_with_style("font_custom_label")
         font_path_layout.addWidget(font_path_label)
@@ -642,262 +696,185 @@ class SettingsPageBuilder:
         self.builder.text_renderer.register_widget(font_path_label, "font_custom_label", group="settings_page")
 
         # 创建输入框
-        from PyQt6.QtWidgets import QLineEdit
-        self.builder.window.font_path_input = QLineEdit()
-        self.builder.window.font_path_input.setStyleSheet(self.builder._get_lineedit_stylesheet())
-        self.builder.window.font_path_input.editingFinished.connect(self.builder.window.on_font_path_changed)
-        font_path_layout.addWidget(self.builder.window.font_path_input, 1)
+        window.font_path_input = QLineEdit()
+        window.font_path_input.setStyleSheet(self.builder._get_lineedit_stylesheet())
+        window.font_path_input.editingFinished.connect(window.on_font_path_changed)
+        font_path_layout.addWidget(window.font_path_input, 1)
 
         # 浏览按钮
-        from widgets import ClickableLabel
-        from utils import load_svg_icon, scale_icon_for_display
         browse_btn = ClickableLabel()
-        browse_btn.setFixedSize(self.builder._scale_size(32), self.builder._scale_size(32))
-        browse_btn.setHoverStyle(
-            f"background:rgba(255,255,255,0.1);border:none;border-radius:{border_radius}px;",
-            f"background:rgba(255,255,255,0.15);border:none;border-radius:{border_radius}px;"
-        )
+        browse_btn.setFixedSize(self._s[32], self._s[32])
+        browse_btn.setHoverStyle(self._get_qss("browse_normal"), self._get_qss("browse_hover"))
         browse_btn.setAlignment(Qt.AlignmentFlag.AlignCenter)
         browse_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        browse_btn.setCallback(self.builder.window.choose_font_file)
-        folder_pixmap = load_svg_icon("svg/folder2.svg", self.builder.dpi_scale)
+        browse_btn.setCallback(window.choose_font_file)
+        folder_pixmap = load_display_icon("svg/folder2.svg", 20, self.builder.dpi_scale)
         if folder_pixmap:
-            browse_btn.setPixmap(scale_icon_for_display(folder_pixmap, 20, self.builder.dpi_scale))
+            browse_btn.setPixmap(folder_pixmap)
         font_path_layout.addWidget(browse_btn)
 
-        self.builder.window.font_path_widget.setVisible(self.builder.window.config.get("font_mode") == 1)
+        window.font_path_widget.setVisible(visible)
 
-        return self.builder.window.font_path_widget
+        return window.font_path_widget
 
     def _create_language_card(self):
         """创建语言选择卡片"""
+        window = self.builder.window
         language_widget = QWidget()
-        border_radius = self.builder._scale_size(8)
-        language_widget.setStyleSheet(
-            f"background:rgba(255,255,255,0);"
-            f"border-bottom-left-radius:{border_radius}px;border-bottom-right-radius:{border_radius}px;"
-        )
+        language_widget.setObjectName("settingsSectionBody")
         language_layout = QHBoxLayout(language_widget)
-        language_layout.setContentsMargins(
-            self.builder._scale_size(35), self.builder._scale_size(12),
-            self.builder._scale_size(15), self.builder._scale_size(12)
-        )
-        language_layout.setSpacing(self.builder._scale_size(10))
+        self._apply_row_margins(language_layout, 35, spacing=10)
 
         language_label = QLabel()
-        language_label.setStyleSheet(
-            f"color:rgba(255,255,255,0.8);font-size:{self.builder._scale_size(13)}px;"
-            f"font-family:'{self.builder._get_font_family()}';"
-        )
+        language_label.setObjectName("settingsLabel")
         language_layout.addWidget(language_label)
 
         self.builder.text_renderer.register_widget(language_label, "settings_language_label", group="settings_page")
 
         language_layout.addStretch()
 
-        self.builder.window.language_combo = QComboBox()
-        self.builder._setup_combobox(self.builder.window.language_combo, width=150, max_items=5)
-
-        # 添加语言选项
-        languages = self.builder.window.language_manager.get_all_languages()
-        for lang_code, display_name in languages:
-            self.builder.window.language_combo.addItem(display_name, lang_code)
+        window.language_combo = QComboBox()
+        self.builder._setup_combobox(window.language_combo, width=150, max_items=5)
+
+        # 添加语言选项（一次性放入模型，同时记录各语言所在行）
+        language_model = QStandardItemModel(window.language_combo)
+        items = []
+        index_by_code = {}
+        for i, (lang_code, display_name) in enumerate(window.language_manager.get_all_languages()):
+            item = QStandardItem(display_name)
+            item.setData(lang_code, Qt.ItemDataRole.UserRole)
+            items.append(item)
+            index_by_code[lang_code] = i
+        if items:
+            language_model.appendColumn(items)
+        window.language_combo.setModel(language_model)
 
         # 设置当前语言
-        current_lang = self.builder.window.language_manager.get_language()
-        for i in range(self.builder.window.language_combo.count()):
-            if self.builder.window.language_combo.itemData(i) == current_lang:
-                self.builder.window.language_combo.setCurrentIndex(i)
-                break
+        current_index = index_by_code.get(window.language_manager.get_language())
+        if current_index is not None:
+            window.language_combo.setCurrentIndex(current_index)
 
-        self.builder.window.language_combo.currentIndexChanged.connect(self.builder.window.change_language)
-        language_layout.addWidget(self.builder.window.language_combo)
+        window.language_combo.currentIndexChanged.connect(window.change_language)
+        language_layout.addWidget(window.language_combo)
 
-        self.builder.window.language_content_layout.addWidget(language_widget)
+        window.language_content_layout.addWidget(language_widget)
 
         return language_widget
 
+    def ensure_blur_toggle_option(self):
+        """确保背景模糊开关已构建并加入外观设置菜单"""
+        window = self.builder.window
+        if not hasattr(window, 'blur_toggle_widget'):
+            self._create_blur_toggle_option()
+            window.appearance_content_layout.addWidget(window.blur_toggle_widget)
+
     def _create_blur_toggle_option(self):
         """创建背景模糊开关选项"""
-        from .components import ToggleSwitch
-        from utils import load_svg_icon, scale_icon_for_display
+        window = self.builder.window
+        blur_enabled = window.config.get("background_blur_enabled", True)
 
-        blur_enabled = self.builder.window.config.get("background_blur_enabled", True)
-
-        self.builder.window.blur_toggle_widget = QWidget()
-        self.builder.window.blur_toggle_widget.setStyleSheet(
-            f"background:rgba(255,255,255,0.08);border-radius:{self.builder._scale_size(8)}px;"
-        )
-        blur_toggle_layout = QHBoxLayout(self.builder.window.blur_toggle_widget)
-        blur_toggle_layout.setContentsMargins(
-            self.builder._scale_size(15), self.builder._scale_size(12),
-            self.builder._scale_size(15), self.builder._scale_size(12)
-        )
-        blur_toggle_layout.setSpacing(self.builder._scale_size(12))
+        window.blur_toggle_widget = QWidget()
+        window.blur_toggle_widget.setObjectName("settingsOption")
+        blur_toggle_layout = QHBoxLayout(window.blur_toggle_widget)
+        self._apply_row_margins(blur_toggle_layout, 15)
 
         text_layout = QVBoxLayout()
-        text_layout.setSpacing(self.builder._scale_size(4))
+        text_layout.setSpacing(self._s[4])
         text_layout.setContentsMargins(0, 0, 0, 0)
 
         title_lbl = QLabel()
-        title_lbl.setStyleSheet(
-            f"color:white;font-size:{self.builder._scale_size(14)}px;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
+        title_lbl.setObjectName("settingsItemTitle")
         text_layout.addWidget(title_lbl)
         self.builder.text_renderer.register_widget(title_lbl, "background_blur_enabled", group="settings_page")
-        title_lbl.setStyleSheet(
-            f"color:white;font-size:{self.builder._scale_size(14)}px;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
-        text_layout.addWidget(title_lbl)
 
         desc_lbl = QLabel()
-        desc_lbl.setStyleSheet(
-            f"color:rgba(255,255,255,0.6);font-size:{self.builder._scale_size(12)}px;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
+        desc_lbl.setObjectName("settingsDesc")
         text_layout.addWidget(desc_lbl)
         self.builder.text_renderer.register_widget(desc_lbl, "background_blur_enabled_desc", group="settings_page")
-        desc_lbl.setStyleSheet(
-            f"color:rgba(255,255,255,0.6);font-size:{self.builder._scale_size(12)}px;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
-        text_layout.addWidget(desc_lbl)
 
         blur_toggle_layout.addLayout(text_layout)
         blur_toggle_layout.addStretch()
 
-        self.builder.window.blur_toggle = ToggleSwitch(checked=blur_enabled, dpi_scale=self.builder.dpi_scale)
-        self.builder.window.blur_toggle.setCallback(lambda checked: self.builder.window.toggle_blur_enabled(checked))
-        blur_toggle_layout.addWidget(self.builder.window.blur_toggle)
-
-        self.builder.window.blur_toggle_widget.setVisible(self.builder.window.config.get("background_mode") == "solid")
+        window.blur_toggle = ToggleSwitch(checked=blur_enabled, dpi_scale=self.builder.dpi_scale)
+        window.blur_toggle.setCallback(window.toggle_blur_enabled)
+        blur_toggle_layout.addWidget(window.blur_toggle)
 
     def _create_version_isolation_option(self):
         """创建版本隔离选项"""
-        from .components import ToggleSwitch
-        from utils import load_svg_icon, scale_icon_for_display
+        window = self.builder.window
+        version_isolation_enabled = window.config.get("version_isolation", True)
 
-        version_isolation_enabled = self.builder.window.config.get("version_isolation", True)
-
-        self.builder.window.version_isolation_widget = QWidget()
-        self.builder.window.version_isolation_widget.setStyleSheet(
-            f"background:rgba(255,255,255,0.08);border-radius:{self.builder._scale_size(8)}px;"
-        )
-        version_isolation_layout = QHBoxLayout(self.builder.window.version_isolation_widget)
-        version_isolation_layout.setContentsMargins(
-            self.builder._scale_size(15), self.builder._scale_size(12),
-            self.builder._scale_size(15), self.builder._scale_size(12)
-        )
-        version_isolation_layout.setSpacing(self.builder._scale_size(12))
+        window.version_isolation_widget = QWidget()
+        window.version_isolation_widget.setObjectName("settingsOption")
+        version_isolation_layout = QHBoxLayout(window.version_isolation_widget)
+        self._apply_row_margins(version_isolation_layout, 15)
 
         # 盒子图标
-        box_icon = load_svg_icon("svg/box-fill.svg", self.builder.dpi_scale)
+        box_icon = load_display_icon("svg/box-fill.svg", 20, self.builder.dpi_scale)
         icon_label = QLabel()
-        icon_label.setFixedSize(self.builder._scale_size(20), self.builder._scale_size(20))
+        icon_label.setFixedSize(self._s[20], self._s[20])
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         if box_icon:
-            icon_label.setPixmap(scale_icon_for_display(box_icon, 20, self.builder.dpi_scale))
+            icon_label.setPixmap(box_icon)
         version_isolation_layout.addWidget(icon_label, 0, Qt.AlignmentFlag.AlignTop)
 
         text_layout = QVBoxLayout()
-        text_layout.setSpacing(self.builder._scale_size(4))
+        text_layout.setSpacing(self._s[4])
         text_layout.setContentsMargins(0, 0, 0, 0)
 
         title_lbl = QLabel()
-        title_lbl.setStyleSheet(
-            f"color:white;font-size:{self.builder._scale_size(14)}px;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
+        title_lbl.setObjectName("settingsItemTitle")
         text_layout.addWidget(title_lbl)
         self.builder.text_renderer.register_widget(title_lbl, "version_isolation", group="settings_page")
-        title_lbl.setStyleSheet(
-            f"color:white;font-size:{self.builder._scale_size(14)}px;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
-        text_layout.addWidget(title_lbl)
 
         desc_lbl = QLabel()
-        desc_lbl.setStyleSheet(
-            f"color:rgba(255,255,255,0.6);font-size:{self.builder._scale_size(12)}px;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
+        desc_lbl.setObjectName("settingsDesc")
         text_layout.addWidget(desc_lbl)
         self.builder.text_renderer.register_widget(desc_lbl, "version_isolation_desc", group="settings_page")
-        desc_lbl.setStyleSheet(
-            f"color:rgba(255,255,255,0.6);font-size:{self.builder._scale_size(12)}px;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
-        text_layout.addWidget(desc_lbl)
 
         version_isolation_layout.addLayout(text_layout)
         version_isolation_layout.addStretch()
 
-        self.builder.window.version_isolation_toggle = ToggleSwitch(checked=version_isolation_enabled, dpi_scale=self.builder.dpi_scale)
-        self.builder.window.version_isolation_toggle.setCallback(lambda checked: self.builder.window.toggle_version_isolation(checked))
-        version_isolation_layout.addWidget(self.builder.window.version_isolation_toggle)
+        window.version_isolation_toggle = ToggleSwitch(checked=version_isolation_enabled, dpi_scale=self.builder.dpi_scale)
+        window.version_isolation_toggle.setCallback(window.toggle_version_isolation)
+        version_isolation_layout.addWidget(window.version_isolation_toggle)
 
     def _create_dev_console_option(self):
         """创建开发控制台选项"""
-        from .components import ToggleSwitch
-        from utils import load_svg_icon, scale_icon_for_display
+        window = self.builder.window
+        dev_console_enabled = window.config.get("dev_console_enabled", False)
 
-        dev_console_enabled = self.builder.window.config.get("dev_console_enabled", False)
-
-        self.builder.window.dev_console_widget = QWidget()
-        self.builder.window.dev_console_widget.setStyleSheet(
-            f"background:rgba(255,255,255,0.08);border-radius:{self.builder._scale_size(8)}px;"
-        )
-        dev_console_layout = QHBoxLayout(self.builder.window.dev_console_widget)
-        dev_console_layout.setContentsMargins(
-            self.builder._scale_size(15), self.builder._scale_size(12),
-            self.builder._scale_size(15), self.builder._scale_size(12)
-        )
-        dev_console_layout.setSpacing(self.builder._scale_size(12))
+        window.dev_console_widget = QWidget()
+        window.dev_console_widget.setObjectName("settingsOption")
+        dev_console_layout = QHBoxLayout(window.dev_console_widget)
+        self._apply_row_margins(dev_console_layout, 15)
 
         # 终端图标
-        console_icon = load_svg_icon("svg/terminal.svg", self.builder.dpi_scale)
+        console_icon = load_display_icon("svg/terminal.svg", 20, self.builder.dpi_scale)
         icon_label = QLabel()
-        icon_label.setFixedSize(self.builder._scale_size(20), self.builder._scale_size(20))
+        icon_label.setFixedSize(self._s[20], self._s[20])
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         if console_icon:
-            icon_label.setPixmap(scale_icon_for_display(console_icon, 20, self.builder.dpi_scale))
+            icon_label.setPixmap(console_icon)
         dev_console_layout.addWidget(icon_label, 0, Qt.AlignmentFlag.AlignTop)
 
         text_layout = QVBoxLayout()
-        text_layout.setSpacing(self.builder._scale_size(4))
+        text_layout.setSpacing(self._s[4])
         text_layout.setContentsMargins(0, 0, 0, 0)
 
         title_lbl = QLabel()
-        title_lbl.setStyleSheet(
-            f"color:white;font-size:{self.builder._scale_size(14)}px;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
+        title_lbl.setObjectName("settingsItemTitle")
         text_layout.addWidget(title_lbl)
         self.builder.text_renderer.register_widget(title_lbl, "dev_console", group="settings_page")
-        title_lbl.setStyleSheet(
-            f"color:white;font-size:{self.builder._scale_size(14)}px;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
-        text_layout.addWidget(title_lbl)
 
         desc_lbl = QLabel()
-        desc_lbl.setStyleSheet(
-            f"color:rgba(255,255,255,0.6);font-size:{self.builder._scale_size(12)}px;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
+        desc_lbl.setObjectName("settingsDesc")
         text_layout.addWidget(desc_lbl)
         self.builder.text_renderer.register_widget(desc_lbl, "dev_console_desc", group="settings_page")
-        desc_lbl.setStyleSheet(
-            f"color:rgba(255,255,255,0.6);font-size:{self.builder._scale_size(12)}px;"
-            f"font-family:'{self.builder._get_font_family()}';background:transparent;"
-        )
-        text_layout.addWidget(desc_lbl)
 
         dev_console_layout.addLayout(text_layout)
         dev_console_layout.addStretch()
 
-        self.builder.window.dev_console_toggle = ToggleSwitch(checked=dev_console_enabled, dpi_scale=self.builder.dpi_scale)
-        self.builder.window.dev_console_toggle.setCallback(lambda checked: self.builder.window.toggle_dev_console(checked))
-        dev_console_layout.addWidget(self.builder.window.dev_console_toggle)
+        window.dev_console_toggle = ToggleSwitch(checked=dev_console_enabled, dpi_scale=self.builder.dpi_scale)
+        window.dev_console_toggle.setCallback(window.toggle_dev_console)
+        dev_console_layout.addWidget(window.dev_console_toggle)
@@ -3,85 +3,17 @@
 提供统一样式表生成方法
 """
 
+from PyQt6.QtWidgets import QComboBox, QListView
 
-class StyleMixin:
-    """样式生成混入类
-
-    为UIBuilder提供样式相关方法
-    """
-
-    def _get_scroll_area_stylesheet(self):
-        """获取统一的滚动区域样式表"""
-        return """
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background: rgba(255, 255, 255, 0.1);
-                width: 8px;
-                border-radius: 4px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(255, 255, 255, 0.3);
-                min-height: 20px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgba(255, 255, 255, 0.5);
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-        """
-
-    def _get_lineedit_stylesheet(self, font_family=None):
-        """获取统一的LineEdit样式表"""
-        if font_family is None:
-            font_family = self._get_font_family()
-        escaped_font = font_family.replace("\\\\", "\\\\\\\\").replace("'", "\\'").replace('"', '\\"')
-        font_family_quoted = f'"{escaped_font}"'
-        padding = self._scale_size(6)
-        border_radius = self._scale_size(4)
-        return (f"QLineEdit{{background:rgba(255,255,255,0.1);border:1px solid rgba(255,255,255,0.2);"
-                f"border-radius:{border_radius}px;padding:{padding}px;color:white;"
-                f"font-size:{self._scale_size(13)}px;font-family:{font_family_quoted};}}")
-
-    def _get_combobox_stylesheet(self, opacity_rgba=None, font_family=None):
-        """生成统一的 QComboBox 样式表"""
-        padding = self._scale_size(6)
-        border_radius = self._scale_size(4)
-
-        # 使用传入的字体，或获取当前字体
-        if font_family is None:
-            font_family = self._get_font_family()
-
-        # 转义字体名称中的特殊字符
-        escaped_font = font_family.replace("\\\\", "\\\\\\\\").replace("'", "\\\'").replace('"', '\\"')
-        font_family_quoted = f'"{escaped_font}"'
-
-        # 计算透明度
-        if opacity_rgba is None:
-            blur_opacity = self.window.config.get("blur_opacity", 150)
-            opacity_value = min(255, blur_opacity + 50)
-            opacity_rgba = opacity_value / 255.0
-        else:
-            opacity_rgba = opacity_rgba
-
-        return f"""QComboBox{{
+# QComboBox 样式表模板（仅尺寸与字体随 DPI/字体变化）
+_COMBOBOX_QSS = """QComboBox{{
             background:rgba(0,0,0,0.3);
             border:1px solid rgba(255,255,255,0.15);
             border-radius:{border_radius}px;
             padding:{padding}px;
             color:rgba(255,255,255,0.95);
-            font-size:{self._scale_size(13)}px;
-            font-family:{font_family_quoted};
+            font-size:{font_size}px;
+            font-family:{font_family};
         }}
         QComboBox:hover{{
             background:rgba(0,0,0,0.4);
@@ -92,8 +24,8 @@ class StyleMixin:
             border:1px solid rgba(100,150,255,0.6);
         }}
         QComboBox:on{{
-            padding-top:{padding - 1}px;
-            padding-bottom:{padding - 1}px;
+            padding-top:{padding_on}px;
+            padding-bottom:{padding_on}px;
         }}
         QComboBox::drop-down{{
             border:none;
@@ -107,15 +39,15 @@ class StyleMixin:
             selection-background-color:rgba(255,255,255,0.3);
             selection-color:white;
             outline:none;
-            padding:{self._scale_size(2)}px;
-            font-family:{font_family_quoted};
+            padding:{view_padding}px;
+            font-family:{font_family};
         }}
         QComboBox QAbstractItemView::item{{
-            height:{self._scale_size(28)}px;
-            padding:{self._scale_size(6)}px {self._scale_size(8)}px;
+            height:{item_height}px;
+            padding:{padding}px {item_padding_h}px;
             color:rgba(255,255,255,0.85);
-            border-radius:{border_radius - 1}px;
-            font-family:{font_family_quoted};
+            border-radius:{item_radius}px;
+            font-family:{font_family};
         }}
         QComboBox QAbstractItemView::item:hover{{
             background:rgba(255,255,255,0.1);
@@ -148,12 +80,108 @@ class StyleMixin:
             background:none;
         }}"""
 
+
+class StyleMixin:
+    """样式生成混入类
+
+    为UIBuilder提供样式相关方法
+    """
+
+    # 滚动区域样式表（不依赖字体和DPI）
+    _SCROLL_AREA_QSS = """
+        QScrollArea {
+            background: transparent;
+            border: none;
+        }
+        QScrollBar:vertical {
+            background: rgba(255, 255, 255, 0.1);
+            width: 8px;
+            border-radius: 4px;
+            margin: 0px;
+        }
+        QScrollBar::handle:vertical {
+            background: rgba(255, 255, 255, 0.3);
+            min-height: 20px;
+            border-radius: 4px;
+        }
+        QScrollBar::handle:vertical:hover {
+            background: rgba(255, 255, 255, 0.5);
+        }
+        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+            border: none;
+            background: none;
+            height: 0px;
+        }
+        QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+            background: none;
+        }
+    """
+
+    def _get_scroll_area_stylesheet(self):
+        """获取统一的滚动区域样式表"""
+        return self._SCROLL_AREA_QSS
+
+    def _get_lineedit_stylesheet(self, font_family=None):
+        """获取统一的LineEdit样式表"""
+        if font_family is None:
+            font_family = self._get_font_family()
+        escaped_font = font_family.replace("\\\\", "\\\\\\\\").replace("'", "\\'").replace('"', '\\"')
+        font_family_quoted = f'"{escaped_font}"'
+        padding = self._scale_size(6)
+        border_radius = self._scale_size(4)
+        return (f"QLineEdit{{background:rgba(255,255,255,0.1);border:1px solid rgba(255,255,255,0.2);"
+                f"border-radius:{border_radius}px;padding:{padding}px;color:white;"
+                f"font-size:{self._scale_size(13)}px;font-family:{font_family_quoted};}}")
+
+    def _get_combobox_stylesheet(self, opacity_rgba=None, font_family=None):
+        """生成统一的 QComboBox 样式表（按字体缓存）
+
+        下拉列表背景为固定值，opacity_rgba 不影响生成结果
+        """
+        # 使用传入的字体，或获取当前字体
+        if font_family is None:
+            font_family = self._get_font_family()
+
+        if not hasattr(self, '_combobox_qss_cache'):
+            self._combobox_qss_cache = {}
+        combobox_qss = self._combobox_qss_cache.get(font_family)
+        if combobox_qss is None:
+            combobox_qss = self._combobox_qss_cache[font_family] = self._build_combobox_stylesheet(font_family)
+        return combobox_qss
+
+    def _build_combobox_stylesheet(self, font_family):
+        """按指定字体构建 QComboBox 样式表"""
+        padding = self._scale_size(6)
+        border_radius = self._scale_size(4)
+
+        # 转义字体名称中的特殊字符
+        escaped_font = font_family.replace("\\\\", "\\\\\\\\").replace("'", "\\\'").replace('"', '\\"')
+        font_family_quoted = f'"{escaped_font}"'
+
+        return _COMBOBOX_QSS.format(
+            padding=padding,
+            padding_on=padding - 1,
+            border_radius=border_radius,
+            item_radius=border_radius - 1,
+            font_size=self._scale_size(13),
+            font_family=font_family_quoted,
+            view_padding=self._scale_size(2),
+            item_height=self._scale_size(28),
+            item_padding_h=self._scale_size(8),
+        )
+
     def _setup_combobox(self, combo, width=200, max_items=8):
         """统一设置 QComboBox 属性"""
-        from PyQt6.QtWidgets import QComboBox
         combo.setFixedHeight(self._scale_size(32))
         combo.setFixedWidth(self._scale_size(width))
         combo.setMaxVisibleItems(max_items)
+        # 沿用下拉框自带的列表视图（保留其菜单样式委托），选项高度一致，按统一行高布局
+        view = combo.view()
+        if isinstance(view, QListView):
+            view.setUniformItemSizes(True)
+            view.setLayoutMode(QListView.LayoutMode.Batched)
+            view.setBatchSize(max_items)
+        combo.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon)
         combo.setStyleSheet(self._get_combobox_stylesheet())
 
     def _update_combobox_font(self, combo_widget, font_family_quoted):
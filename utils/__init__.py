@@ -1,9 +1,10 @@
 """工具函数模块"""
 
-from .icons import load_svg_icon, scale_icon_for_display
+from .icons import load_svg_icon, scale_icon_for_display, load_display_icon, preload_all_icons
 from .path_helper import get_resource_path
 
-__all__ = ['load_svg_icon', 'scale_icon_for_display', 'get_resource_path']
+__all__ = ['load_svg_icon', 'scale_icon_for_display', 'load_display_icon', 'preload_all_icons',
+           'get_resource_path', 'normalize_path']
 
 
 def normalize_path(path):
@@ -2,21 +2,33 @@
 
 import os
 import sys
-from PyQt6.QtGui import QPixmap, QColor, QIcon
+from functools import lru_cache
+from PyQt6.QtGui import QColor, QIcon, QPainter
 from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QApplication
 
+from .path_helper import get_resource_path
 
-def _get_device_pixel_ratio():
-    """获取当前设备像素比"""
-    screen = QApplication.primaryScreen()
-    if screen:
-        return screen.devicePixelRatio()
-    return 1.0
+# 已着色为白色的 SVG 图标：path -> QPixmap 或 None
+_SVG_ICON_CACHE = {}
+
+# 已缩放到显示尺寸的图标：(path, size, dpi_scale) -> QPixmap 或 None
+_DISPLAY_ICON_CACHE = {}
 
 
 def load_svg_icon(path, dpi_scale=1.0):
-    # 获取 SVG 文件的正确路径
+    # 同一图标只渲染、着色一次（QPixmap 为隐式共享，可直接复用）
+    try:
+        return _SVG_ICON_CACHE[path]
+    except KeyError:
+        pass
+    pixmap = _render_svg_icon(path)
+    _SVG_ICON_CACHE[path] = pixmap
+    return pixmap
+
+
+@lru_cache(maxsize=256)
+def _resolve_svg_path(path):
+    """解析 SVG 文件的实际路径，不存在时返回 None（按路径缓存）"""
     if hasattr(sys, '_MEIPASS'):
         # 打包后环境，优先从 _internal 读取
         svg_path = os.path.join(sys._MEIPASS, path.replace('\\', os.sep))
@@ -28,22 +40,39 @@ def load_svg_icon(path, dpi_scale=1.0):
         svg_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", path.replace('\\', os.sep))
         svg_path = os.path.abspath(svg_path)
     if os.path.exists(svg_path):
+        return svg_path
+    return None
+
+
+def _render_svg_icon(path):
+    svg_path = _resolve_svg_path(path)
+    if svg_path:
         icon = QIcon(svg_path)
         if not icon.isNull():
             base_size = 32
             pixmap = icon.pixmap(base_size, base_size)
             if not pixmap.isNull():
-                image = pixmap.toImage()
-                for y in range(image.height()):
-                    for x in range(image.width()):
-                        color = image.pixelColor(x, y)
-                        if color.alpha() > 0:
-                            image.setPixelColor(x, y, QColor(255, 255, 255, color.alpha()))
-                result = QPixmap.fromImage(image)
-                return result
+                # 保留原有透明度，把所有像素着色为白色
+                painter = QPainter(pixmap)
+                painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+                painter.fillRect(pixmap.rect(), QColor(255, 255, 255))
+                painter.end()
+                return pixmap
     return None
 
 
+def preload_all_icons(svg_dir="svg"):
+    """启动时一次性渲染目录下全部 SVG 图标，之后的 load_svg_icon 只需查表"""
+    try:
+        entries = os.scandir(get_resource_path(svg_dir))
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.name.endswith(".svg") and entry.is_file():
+                load_svg_icon(f"{svg_dir}/{entry.name}")
+
+
 def scale_icon_for_display(pixmap, size, dpi_scale=1.0):
     if pixmap.isNull():
         return pixmap
@@ -53,3 +82,20 @@ def scale_icon_for_display(pixmap, size, dpi_scale=1.0):
         Qt.AspectRatioMode.KeepAspectRatio,
         Qt.TransformationMode.SmoothTransformation
     )
+
+
+def load_display_icon(path, size, dpi_scale=1.0):
+    """加载 SVG 图标并缩放到显示尺寸，结果按 (路径, 尺寸, DPI) 缓存
+
+    返回的 QPixmap 可在多个控件间共享；图标不存在时返回 None
+    """
+    key = (path, size, dpi_scale)
+    try:
+        return _DISPLAY_ICON_CACHE[key]
+    except KeyError:
+        pass
+    pixmap = load_svg_icon(path, dpi_scale)
+    if pixmap:
+        pixmap = scale_icon_for_display(pixmap, size, dpi_scale)
+    _DISPLAY_ICON_CACHE[key] = pixmap
+    return pixmap
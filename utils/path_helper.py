@@ -2,14 +2,17 @@
 
 import os
 import sys
+from functools import lru_cache
 
 
+@lru_cache(maxsize=256)
 def get_resource_path(relative_path):
     """获取资源文件的绝对路径（支持开发环境和打包后环境）
     
     在开发环境中，返回项目根目录的相对路径
     在打包后环境中，返回 _MEIPASS 临时目录的相对路径
     对于 config.json 和 lang/ 目录，始终从当前工作目录读取
+    结果按相对路径缓存（程序运行期间不切换工作目录）
     
     Args:
         relative_path: 相对路径
@@ -1,11 +1,26 @@
 """自定义组件模块"""
 
+import importlib
+
 from .buttons import JellyButton, CardButton, make_transparent
 from .labels import ClickableLabel
 from .cards import NewsCard, get_current_font, set_current_font
-from .file_explorer import FileExplorer
 from .text_renderer import TextRenderer
-from .modrinth_cards import ModrinthResultCard
-from .resourcepack_config_editor_page import ResourcepackConfigEditorPage
+
+# 启动时用不到的较重组件：名称 -> 子模块，首次访问时再导入
+_LAZY_IMPORTS = {
+    'FileExplorer': '.file_explorer',
+    'ModrinthResultCard': '.modrinth_cards',
+    'ResourcepackConfigEditorPage': '.resourcepack_config_editor_page',
+}
 
 __all__ = ['JellyButton', 'CardButton', 'ClickableLabel', 'make_transparent', 'NewsCard', 'get_current_font', 'set_current_font', 'FileExplorer', 'TextRenderer', 'ModrinthResultCard', 'ResourcepackConfigEditorPage']
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,7 +1,7 @@
 """自定义按钮组件"""
 
 from PyQt6.QtCore import QPropertyAnimation, QEasingCurve, Qt
-from PyQt6.QtGui import QPainter
+from PyQt6.QtGui import QPainter, QPixmap, QTransform
 from PyQt6.QtWidgets import (QHBoxLayout, QPushButton, QStyleOptionButton,
                              QStylePainter, QVBoxLayout, QWidget)
 
@@ -13,10 +13,29 @@ def make_transparent(widget):
     return widget
 
 
-class JellyButton(QPushButton):
-    def __init__(self, text="", parent=None):
-        super().__init__(text, parent)
+class _ScalablePushButton(QPushButton):
+    """按下时带缩放动画的按钮基类
+
+    子类通过 _PRESS / _RELEASE 指定按下、松开动画的 (目标缩放, 时长, 缓动曲线)
+    """
+
+    _PRESS = (0.92, 100, QEasingCurve.Type.OutQuad)
+    _RELEASE = (1.0, 150, QEasingCurve.Type.OutBack)
+
+    def __init__(self, *args):
+        super().__init__(*args)
         self._scale = 1.0
+        # 最近一次绘制时的缩放比例
+        self._painted_scale = 1.0
+        # 以按钮中心缩放的绘制变换，随缩放比例和尺寸更新
+        self._xform = QTransform()
+        # 缩放动画期间使用的按钮图像及其对应的 (宽, 高, 状态, 文字, 图标)
+        self._cached_pm = None
+        self._cache_key = None
+        # 按下动画，首次按下时创建
+        self.anim = None
+        # 绘制用的样式选项，每次绘制时重新填充
+        self._opt = QStyleOptionButton()
         self.setMouseTracking(True)
 
     def getScale(self):
@@ -24,104 +43,106 @@ class JellyButton(QPushButton):
 
     def setScale(self, s):
         self._scale = s
-        self.update()
+        self._update_transform()
+        # 与上次绘制相比尺寸变化不足一个设备像素时不重绘（恢复到 1.0 时总是重绘）
+        extent = max(self.width(), self.height()) * self.devicePixelRatioF()
+        if s == 1.0 or round(s * extent) != round(self._painted_scale * extent):
+            self.update()
 
-    def paintEvent(self, ev):
-        painter = QStylePainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    def _update_transform(self):
         cx, cy = self.width() / 2, self.height() / 2
-        painter.translate(cx, cy)
-        painter.scale(self._scale, self._scale)
-        painter.translate(-cx, -cy)
-        opt = QStyleOptionButton()
+        xform = QTransform()
+        xform.translate(cx, cy)
+        xform.scale(self._scale, self._scale)
+        xform.translate(-cx, -cy)
+        self._xform = xform
+
+    def resizeEvent(self, ev):
+        self._update_transform()
+        super().resizeEvent(ev)
+
+    def paintEvent(self, ev):
+        opt = self._opt
         self.initStyleOption(opt)
+        self._painted_scale = self._scale
+        if self._scale == 1.0:
+            # 未缩放时直接绘制，并释放动画用的缓存图像
+            self._cached_pm = None
+            painter = QStylePainter(self)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.drawControl(self.style().ControlElement.CE_PushButton, opt)
+            return
+
+        # 缩放动画期间按钮外观不变，只绘制一次到缓存图像，之后每帧缩放贴图
+        cache_key = (self.width(), self.height(), opt.state, self.text(), self.icon().cacheKey())
+        if self._cached_pm is None or cache_key != self._cache_key:
+            self._cached_pm = self._render_pixmap(opt)
+            self._cache_key = cache_key
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.setWorldTransform(self._xform)
+        painter.drawPixmap(0, 0, self._cached_pm)
+
+    def _render_pixmap(self, opt):
+        """把未缩放的按钮绘制到透明图像上"""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QStylePainter(pixmap, self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.drawControl(self.style().ControlElement.CE_PushButton, opt)
+        painter.end()
+        return pixmap
+
+    def changeEvent(self, ev):
+        # 样式、字体等变化后缓存图像失效
+        self._cached_pm = None
+        super().changeEvent(ev)
 
     def _animate(self, end, duration, curve):
-        # 停止之前的动画
-        if hasattr(self, 'anim') and self.anim is not None:
+        # 动画对象在首次按下时创建，之后停止并复用
+        if self.anim is not None:
             self.anim.stop()
-            self.anim.deleteLater()
-        
-        self.anim = QPropertyAnimation()
+        else:
+            self.anim = QPropertyAnimation(self)
+            self.anim.valueChanged.connect(self.setScale)
         self.anim.setDuration(duration)
         self.anim.setStartValue(self._scale)
         self.anim.setEndValue(end)
         self.anim.setEasingCurve(curve)
-        self.anim.valueChanged.connect(self.setScale)
         self.anim.start()
 
     def mousePressEvent(self, ev):
-        self._animate(0.92, 100, QEasingCurve.Type.OutQuad)
+        self._animate(*self._PRESS)
         super().mousePressEvent(ev)
 
     def mouseReleaseEvent(self, ev):
-        self._animate(1.0, 150, QEasingCurve.Type.OutBack)
+        self._animate(*self._RELEASE)
         super().mouseReleaseEvent(ev)
 
-    def mouseMoveEvent(self, ev):
-        win = self.window()
-        if hasattr(win, 'update_cursor'):
-            win.update_cursor(ev.globalPosition().toPoint())
-        super().mouseMoveEvent(ev)
-    
     def deleteLater(self):
-        """删除对象时停止动画"""
-        if hasattr(self, 'anim') and self.anim is not None:
+        """删除对象时停止动画（动画对象随按钮一起释放）"""
+        if self.anim is not None:
             self.anim.stop()
-            self.anim.deleteLater()
         super().deleteLater()
 
 
-class CardButton(QPushButton):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self._scale = 1.0
-        self.setMouseTracking(True)
-
-    def getScale(self):
-        return self._scale
-
-    def setScale(self, s):
-        self._scale = s
-        self.update()
+class JellyButton(_ScalablePushButton):
+    def __init__(self, text="", parent=None):
+        super().__init__(text, parent)
 
-    def paintEvent(self, ev):
-        painter = QStylePainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        cx, cy = self.width() / 2, self.height() / 2
-        painter.translate(cx, cy)
-        painter.scale(self._scale, self._scale)
-        painter.translate(-cx, -cy)
-        opt = QStyleOptionButton()
-        self.initStyleOption(opt)
-        painter.drawControl(self.style().ControlElement.CE_PushButton, opt)
+    def mouseMoveEvent(self, ev):
+        win = self.window()
+        if hasattr(win, 'update_cursor'):
+            win.update_cursor(ev.globalPosition().toPoint())
+        super().mouseMoveEvent(ev)
 
-    def _animate(self, end, duration, curve):
-        # 停止之前的动画
-        if hasattr(self, 'anim') and self.anim is not None:
-            self.anim.stop()
-            self.anim.deleteLater()
-        
-        self.anim = QPropertyAnimation()
-        self.anim.setDuration(duration)
-        self.anim.setStartValue(self._scale)
-        self.anim.setEndValue(end)
-        self.anim.setEasingCurve(curve)
-        self.anim.valueChanged.connect(self.setScale)
-        self.anim.start()
 
-    def mousePressEvent(self, ev):
-        self._animate(0.97, 80, QEasingCurve.Type.Linear)
-        super().mousePressEvent(ev)
+class CardButton(_ScalablePushButton):
+    _PRESS = (0.97, 80, QEasingCurve.Type.Linear)
+    _RELEASE = (1.0, 120, QEasingCurve.Type.Linear)
 
-    def mouseReleaseEvent(self, ev):
-        self._animate(1.0, 120, QEasingCurve.Type.Linear)
-        super().mouseReleaseEvent(ev)
-    
-    def deleteLater(self):
-        """删除对象时停止动画"""
-        if hasattr(self, 'anim') and self.anim is not None:
-            self.anim.stop()
-            self.anim.deleteLater()
-        super().deleteLater()
+    def __init__(self, parent=None):
+        super().__init__(parent)
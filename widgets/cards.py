@@ -1,5 +1,7 @@
 """自定义卡片组件"""
 
+from functools import lru_cache
+
 from PyQt6.QtCore import (QPropertyAnimation, QEasingCurve, QTimer, Qt)
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (QGraphicsOpacityEffect, QHBoxLayout, QLabel,
@@ -10,6 +12,55 @@ from PyQt6.QtWidgets import (QGraphicsOpacityEffect, QHBoxLayout, QLabel,
 _current_font_family = "Microsoft YaHei UI"
 
 
+# 卡片容器样式表模板（圆角随 DPI 缩放）
+_CARD_CONTAINER_QSS = """
+            #card_container {{
+                background: rgba(0, 0, 0, 0.45);
+                border: 1px solid rgba(255, 255, 255, 0.2);
+                border-radius: {radius}px;
+            }}
+            #card_container:hover {{
+                background: rgba(0, 0, 0, 0.55);
+                border: 1px solid rgba(255, 255, 255, 0.3);
+            }}
+        """
+
+# 标题与正文样式表模板（字体与字号随设置变化）
+_TITLE_QSS = """
+            QLabel {{
+                color: white;
+                background: transparent;
+                font-family: {font};
+                font-size: {size}px;
+                font-weight: bold;
+            }}
+        """
+_CONTENT_QSS = """
+            QLabel {{
+                color: rgba(255, 255, 255, 0.85);
+                background: transparent;
+                font-family: {font};
+                font-size: {size}px;
+            }}
+        """
+
+
+@lru_cache(maxsize=32)
+def _card_container_qss(dpi_scale):
+    """按 DPI 生成卡片容器样式表（结果缓存）"""
+    return _CARD_CONTAINER_QSS.format(radius=int(12 * dpi_scale))
+
+
+@lru_cache(maxsize=32)
+def _label_qss(font_family, dpi_scale):
+    """按字体与 DPI 生成 (标题, 正文) 样式表（结果缓存）"""
+    # 转义字体名称中的特殊字符，使用双引号包裹字体名称，避免单引号问题
+    escaped_font = font_family.replace("\\", "\\\\").replace("'", "\\'").replace('"', '\\"')
+    font_family_quoted = f'"{escaped_font}"'
+    return (_TITLE_QSS.format(font=font_family_quoted, size=int(13 * dpi_scale)),
+            _CONTENT_QSS.format(font=font_family_quoted, size=int(11 * dpi_scale)))
+
+
 def get_current_font():
     """获取当前字体系列"""
     global _current_font_family
@@ -109,23 +160,23 @@ class NewsCard(QWidget):
         # 卡片样式
         self._update_card_style()
         
-        # 创建透明度效果
+        # 淡入前保持透明；透明度效果只在淡入淡出期间存在，静止时卡片直接绘制
+        self.opacity_effect = None
+        self._install_opacity_effect(0.0)
+    
+    def _install_opacity_effect(self, opacity):
+        """安装透明度效果（setGraphicsEffect 会释放之前的效果）"""
         self.opacity_effect = QGraphicsOpacityEffect(self)
-        self.opacity_effect.setOpacity(0.0)
+        self.opacity_effect.setOpacity(opacity)
         self.setGraphicsEffect(self.opacity_effect)
-    
+
+    def _remove_opacity_effect(self):
+        """淡入完成后移除透明度效果，避免每次重绘都经过离屏缓冲"""
+        self.setGraphicsEffect(None)
+        self.opacity_effect = None
+
     def _update_card_style(self):
-        self.card_container.setStyleSheet(f"""
-            #card_container {{
-                background: rgba(0, 0, 0, 0.45);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: {int(12 * self.dpi_scale)}px;
-            }}
-            #card_container:hover {{
-                background: rgba(0, 0, 0, 0.55);
-                border: 1px solid rgba(255, 255, 255, 0.3);
-            }}
-        """)
+        self.card_container.setStyleSheet(_card_container_qss(self.dpi_scale))
     
     def set_content(self, title, content):
         self.title_label.setText(title)
@@ -137,33 +188,10 @@ class NewsCard(QWidget):
     def update_font(self, font_family):
         """更新卡片字体"""
         self._font_family = font_family
-        # 转义字体名称中的特殊字符
-        escaped_font = font_family.replace("\\", "\\\\").replace("'", "\\'").replace('"', '\\"')
-        # 使用双引号包裹字体名称，避免单引号问题
-        font_family_quoted = f'"{escaped_font}"'
-
         # 使用样式表设置字体（优先级高于 setFont）
-        title_font_size = int(13 * self.dpi_scale)
-        content_font_size = int(11 * self.dpi_scale)
-
-        self.title_label.setStyleSheet(f"""
-            QLabel {{
-                color: white;
-                background: transparent;
-                font-family: {font_family_quoted};
-                font-size: {title_font_size}px;
-                font-weight: bold;
-            }}
-        """)
-
-        self.content_label.setStyleSheet(f"""
-            QLabel {{
-                color: rgba(255, 255, 255, 0.85);
-                background: transparent;
-                font-family: {font_family_quoted};
-                font-size: {content_font_size}px;
-            }}
-        """)
+        title_qss, content_qss = _label_qss(font_family, self.dpi_scale)
+        self.title_label.setStyleSheet(title_qss)
+        self.content_label.setStyleSheet(content_qss)
 
     def fade_in(self, duration=300):
         """淡入动画"""
@@ -172,11 +200,14 @@ class NewsCard(QWidget):
             self.anim.stop()
             self.anim.deleteLater()
         
+        if self.opacity_effect is None:
+            self._install_opacity_effect(0.0)
         self.anim = QPropertyAnimation(self.opacity_effect, b"opacity")
         self.anim.setDuration(duration)
         self.anim.setStartValue(0.0)
         self.anim.setEndValue(1.0)
         self.anim.setEasingCurve(QEasingCurve.Type.OutQuad)
+        self.anim.finished.connect(self._remove_opacity_effect)
         self.anim.start()
     
     def fade_out(self, duration=200, callback=None):
@@ -186,6 +217,8 @@ class NewsCard(QWidget):
             self.anim.stop()
             self.anim.deleteLater()
         
+        if self.opacity_effect is None:
+            self._install_opacity_effect(1.0)
         self.anim = QPropertyAnimation(self.opacity_effect, b"opacity")
         self.anim.setDuration(duration)
         self.anim.setStartValue(1.0)
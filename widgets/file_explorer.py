@@ -3,15 +3,134 @@
 import os
 import logging
 import zipfile
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QEvent
+from functools import lru_cache
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QEvent, QThread
 from PyQt6.QtGui import QFont, QIcon, QPixmap, QWheelEvent
 from PyQt6.QtWidgets import (QFileDialog, QGridLayout, QHBoxLayout, QHeaderView, QLabel,
                              QLineEdit, QPushButton, QTreeWidget, QTreeWidgetItem,
                              QVBoxLayout, QWidget, QStackedWidget)
-from utils import load_svg_icon, scale_icon_for_display
+from utils import load_display_icon, load_svg_icon, scale_icon_for_display
 
 logger = logging.getLogger(__name__)
 
+# update_font 使用的样式表模板（字体与尺寸随设置变化）
+_PAGE_TITLE_QSS = """
+            QLabel {{
+                color: white;
+                background: transparent;
+                font-size: {title_size}px;
+                font-weight: bold;
+                font-family: {font};
+            }}
+        """
+_PATH_LABEL_QSS = """
+            QLabel {{
+                color: rgba(255,255,255, 0.7);
+                background: transparent;
+                font-size: {size}px;
+                font-family: {font};
+            }}
+        """
+_FILE_TREE_QSS = """
+            QTreeWidget {{
+                background: rgba(0, 0, 0, 0.2);
+                border:1px solid rgba(255, 255, 255, 0.1);
+                border-radius: {radius}px;
+                color: rgba(255, 255, 255, 0.9);
+                font-family: {font};
+            }}
+            QTreeWidget::item {{
+                padding: {item_padding}px;
+            }}
+            QTreeWidget::item:hover {{
+                background: rgba(255, 255, 255, 0.1);
+            }}
+            QTreeWidget::item:selected {{
+                background: rgba(100, 150, 255, 0.3);
+                color: white;
+            }}
+            QTreeWidget::branch {{
+                background: transparent;
+            }}
+            QTreeWidget::branch:has-children:closed {{
+                image: none;
+            }}
+            QTreeWidget::branch:has-children:open {{
+                image: none;
+            }}
+            QHeaderView::section {{
+                background: rgba(255, 255, 255, 0.08);
+                color: rgba(255, 255, 255, 0.7);
+                padding: {header_padding}px;
+                border: none;
+                border-right: 1px solid rgba(255, 255, 255, 0.1);
+                font-size: {header_size}px;
+                font-weight: bold;
+                font-family: {font};
+            }}
+        """
+
+
+@lru_cache(maxsize=32)
+def _font_qss(font_family, dpi_scale):
+    """按字体与 DPI 生成 (页面标题, 路径标签, 文件树) 样式表（结果缓存）"""
+    escaped_font = font_family.replace("\\", "\\\\").replace("'", "\\'").replace('"', '\\"')
+    font_family_quoted = f'"{escaped_font}"'
+    return (
+        _PAGE_TITLE_QSS.format(font=font_family_quoted, title_size=int(20 * dpi_scale)),
+        _PATH_LABEL_QSS.format(font=font_family_quoted, size=int(13 * dpi_scale)),
+        _FILE_TREE_QSS.format(
+            font=font_family_quoted,
+            radius=int(4 * dpi_scale),
+            item_padding=int(4 * dpi_scale),
+            header_padding=int(6 * dpi_scale),
+            header_size=int(11 * dpi_scale),
+        ),
+    )
+
+
+# 正在运行的目录扫描线程（保持引用直到线程结束，避免线程对象被提前回收）
+_RUNNING_SCANS = set()
+
+
+class DirectoryScanThread(QThread):
+    """目录扫描线程，在后台列出目录项，避免慢速磁盘阻塞界面"""
+    scan_finished = pyqtSignal(int, object, object)  # generation, items, entries
+    scan_failed = pyqtSignal(int, object)  # generation, exception
+
+    def __init__(self, generation, path, with_stat=False):
+        super().__init__()
+        self.generation = generation
+        self.path = path
+        self.with_stat = with_stat  # 同时读取文件状态（大小、修改时间），结果缓存在 DirEntry 中
+        self.finished.connect(self._release)
+
+    def run(self):
+        try:
+            # os.scandir 返回的目录项自带类型信息（Windows 上还带有文件大小和时间）
+            items = []
+            entries = {}
+            with os.scandir(self.path) as it:
+                for entry in it:
+                    items.append((entry.name, entry.is_dir(), entry.path))
+                    entries[entry.path] = entry
+                    if self.with_stat:
+                        try:
+                            entry.stat()
+                        except OSError:
+                            pass
+            self.scan_finished.emit(self.generation, items, entries)
+        except Exception as e:
+            self.scan_failed.emit(self.generation, e)
+
+    def start(self):
+        _RUNNING_SCANS.add(self)
+        super().start()
+
+    def _release(self):
+        self.wait()
+        _RUNNING_SCANS.discard(self)
+
 
 class ResourcepackItemWidget(QWidget):
     """资源包项目部件，支持收藏按钮，使用卡片样式（类似下载页面）"""
@@ -323,6 +442,7 @@ class FileExplorer(QWidget):
         self._cached_folders = []  # 缓存的文件夹数据: [(name, is_dir, full_path)]
         self._cache_valid = False  # 缓存是否有效
         self._search_timer = None  # 搜索防抖定时器
+        self._scan_generation = 0  # 目录扫描序号，用于丢弃过期的扫描结果
         self._init_ui()
 
     def translate(self, key, **kwargs):
@@ -952,6 +1072,8 @@ class FileExplorer(QWidget):
         self._cached_resourcepacks = []  # 清空资源包缓存
         self._cached_folders = []  # 清空文件夹缓存
         self._cache_valid = False  # 标记缓存无效
+        # 之前未完成的扫描结果作废
+        self._scan_generation += 1
 
         self.file_tree.show()
 
@@ -967,21 +1089,36 @@ class FileExplorer(QWidget):
             self.file_tree.hide()
             return
 
-        try:
-            items = []
-            for item in os.listdir(path):
-                full_path = os.path.join(path, item)
-                if os.path.isdir(full_path):
-                    # 如果是versions目录，只显示子目录
-                    if os.path.basename(path) == "versions" and os.path.isdir(full_path):
-                        items.append((item, True, full_path))
-                    # 如果是其他目录，显示所有文件夹
-                    elif os.path.basename(path) != "versions":
-                        items.append((item, True, full_path))
-                else:
-                    # 显示文件
-                    items.append((item, False, full_path))
+        # 在后台线程中列出目录，完成后回到主线程填充文件树
+        scan = DirectoryScanThread(self._scan_generation, path, with_stat=self.resourcepack_mode)
+        # 使用 QueuedConnection 确保在主线程执行
+        scan.scan_finished.connect(self._on_directory_scanned, Qt.ConnectionType.QueuedConnection)
+        scan.scan_failed.connect(self._on_directory_scan_failed, Qt.ConnectionType.QueuedConnection)
+        scan.start()
+
+    def _on_directory_scanned(self, generation, items, entries):
+        """目录扫描完成回调"""
+        if generation != self._scan_generation:
+            return  # 已切换到其他目录，丢弃过期结果
+        self._populate_directory(items, entries)
+
+    def _on_directory_scan_failed(self, generation, error):
+        """目录扫描失败回调"""
+        if generation != self._scan_generation:
+            return
+        if not isinstance(error, PermissionError):
+            logger.error(f"Error loading directory: {error}", exc_info=error)
+        self.file_tree.hide()
+        self.path_card.hide()
+
+    def _populate_directory(self, items, entries):
+        """用扫描得到的目录项填充文件树
 
+        Args:
+            items: [(name, is_dir, full_path)]
+            entries: {full_path: DirEntry}
+        """
+        try:
             # 排序：文件夹在前，文件在后
             items.sort(key=lambda x: (not x[1], x[0]))
 
@@ -1017,15 +1154,14 @@ class FileExplorer(QWidget):
                 logger.info(f"Resourcepack mode: found {len(resourcepack_items)} valid resourcepacks and {len(non_resourcepack_dirs)} folders out of {len(items)} items")
 
                 # 缓存所有资源包数据（包括图标、描述等）
-                self._cache_resourcepack_data(resourcepack_items, non_resourcepack_dirs, favorited_resourcepacks)
+                self._cache_resourcepack_data(resourcepack_items, non_resourcepack_dirs, favorited_resourcepacks, entries)
 
                 # 从缓存中刷新显示
                 self._refresh_display_from_cache()
             else:
                 # 非资源包模式，正常显示
                 self.search_container.hide()
-                for name, is_dir, full_path in items:
-                    self._add_item(name, is_dir, full_path)
+                self._add_tree_items([self._create_item(name, is_dir, full_path) for name, is_dir, full_path in items])
 
             # 检查当前路径是否为版本隔离的子路径
             is_version_subpath = self.base_path and self.current_path != self.base_path and "versions" in self.current_path
@@ -1059,13 +1195,32 @@ class FileExplorer(QWidget):
             self.file_tree.hide()
             self.path_card.hide()
 
-    def _add_item(self, name, is_dir, full_path):
-        """添加普通项目（文件夹使用ResourcepackItemWidget样式）"""
+    def _add_tree_items(self, entries):
+        """批量添加顶层项目
+
+        Args:
+            entries: [(QTreeWidgetItem, 项目部件或 None)]，项目一次性插入后再设置部件
+        """
+        if not entries:
+            return
+        tree = self.file_tree
+        tree.setUpdatesEnabled(False)
+        tree.blockSignals(True)
+        try:
+            tree.addTopLevelItems([item for item, _ in entries])
+            for item, widget in entries:
+                if widget is not None:
+                    tree.setItemWidget(item, 0, widget)
+        finally:
+            tree.blockSignals(False)
+            tree.setUpdatesEnabled(True)
+
+    def _create_item(self, name, is_dir, full_path):
+        """创建普通项目（文件夹使用ResourcepackItemWidget样式），返回 (项目, 部件或 None)"""
         if is_dir:
             # 文件夹：使用ResourcepackItemWidget样式（不可收藏，无描述）
             item = QTreeWidgetItem()
             item.setData(0, Qt.ItemDataRole.UserRole, full_path)
-            self.file_tree.addTopLevelItem(item)
 
             # 获取文件夹图标（使用与资源包相同的渲染逻辑）
             icon_pixmap = self._get_resourcepack_icon_pixmap(full_path, is_dir)
@@ -1086,17 +1241,15 @@ class FileExplorer(QWidget):
                 modified_time=""
             )
 
-            # 设置项目部件
-            self.file_tree.setItemWidget(item, 0, widget)
-
             # 添加占位子项
             QTreeWidgetItem(item).setText(0, "...")
-        else:
-            # 文件：使用普通样式
-            item = QTreeWidgetItem()
-            item.setText(0, name)
-            item.setData(0, Qt.ItemDataRole.UserRole, full_path)
-            self.file_tree.addTopLevelItem(item)
+            return item, widget
+
+        # 文件：使用普通样式
+        item = QTreeWidgetItem()
+        item.setText(0, name)
+        item.setData(0, Qt.ItemDataRole.UserRole, full_path)
+        return item, None
 
     def _add_resourcepack_item(self, name, is_dir, full_path, is_favorited):
         """添加资源包项目（带收藏按钮，使用卡片样式）"""
@@ -1247,14 +1400,17 @@ class FileExplorer(QWidget):
         config_page.deleteLater()
 
 
-    def _cache_resourcepack_data(self, resourcepack_items, non_resourcepack_dirs, favorited_resourcepacks):
+    def _cache_resourcepack_data(self, resourcepack_items, non_resourcepack_dirs, favorited_resourcepacks, entries=None):
         """缓存资源包和文件夹数据
         
         Args:
             resourcepack_items: 资源包列表 [(name, is_dir, full_path)]
             non_resourcepack_dirs: 非资源包文件夹列表 [(name, is_dir, full_path)]
             favorited_resourcepacks: 收藏的资源包路径列表
+            entries: 可选，os.scandir 得到的目录项 {full_path: DirEntry}，用于复用文件状态
         """
+        if entries is None:
+            entries = {}
         self._cached_folders = list(non_resourcepack_dirs)  # 缓存文件夹
         
         # 缓存资源包数据（包括图标、描述等）
@@ -1272,15 +1428,16 @@ class FileExplorer(QWidget):
             file_size = ""
             modified_time = ""
             try:
+                entry = entries.get(full_path)
+                stat = entry.stat() if entry is not None else os.stat(full_path)
                 if is_dir:
                     # 文件夹：显示"文件夹"文字
                     file_size = "文件夹"
                 else:
                     # 文件：显示文件大小
-                    size = os.path.getsize(full_path)
-                    file_size = self._format_size(size)
+                    file_size = self._format_size(stat.st_size)
                 # 获取修改时间（文件夹和文件都显示）
-                mtime = os.path.getmtime(full_path)
+                mtime = stat.st_mtime
                 import datetime
                 modified_time = datetime.datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M")
             except Exception:
@@ -1375,17 +1532,11 @@ class FileExplorer(QWidget):
         # 文件夹置顶显示（按名称排序）
         filtered_folders.sort(key=lambda x: x[0])
         
-        # 添加文件夹
-        for name, is_dir, full_path in filtered_folders:
-            self._add_item(name, is_dir, full_path)
-        
-        # 先添加收藏的资源包
-        for name, is_dir, full_path, icon_pixmap, description, file_size, modified_time, is_favorited, is_editable in favorites:
-            self._add_resourcepack_item_from_cache(name, is_dir, full_path, is_favorited, icon_pixmap, description, file_size, modified_time, is_editable)
-        
-        # 再添加非收藏的资源包
-        for name, is_dir, full_path, icon_pixmap, description, file_size, modified_time, is_favorited, is_editable in non_favorites:
-            self._add_resourcepack_item_from_cache(name, is_dir, full_path, is_favorited, icon_pixmap, description, file_size, modified_time, is_editable)
+        # 依次为文件夹、收藏的资源包、非收藏的资源包，最后一次性加入文件树
+        entries = [self._create_item(name, is_dir, full_path) for name, is_dir, full_path in filtered_folders]
+        for name, is_dir, full_path, icon_pixmap, description, file_size, modified_time, is_favorited, is_editable in favorites + non_favorites:
+            entries.append(self._create_resourcepack_item_from_cache(name, is_dir, full_path, is_favorited, icon_pixmap, description, file_size, modified_time, is_editable))
+        self._add_tree_items(entries)
         
         # 检查当前路径是否为版本隔离的子路径
         is_version_subpath = self.base_path and self.current_path != self.base_path and "versions" in self.current_path
@@ -1411,11 +1562,10 @@ class FileExplorer(QWidget):
             self.file_tree.setMinimumHeight(total_height)
             self.file_tree.setMaximumHeight(total_height)
     
-    def _add_resourcepack_item_from_cache(self, name, is_dir, full_path, is_favorited, icon_pixmap, description, file_size, modified_time, is_editable):
-        """从缓存添加资源包项目（带收藏按钮，使用卡片样式）"""
+    def _create_resourcepack_item_from_cache(self, name, is_dir, full_path, is_favorited, icon_pixmap, description, file_size, modified_time, is_editable):
+        """从缓存创建资源包项目（带收藏按钮，使用卡片样式），返回 (项目, 部件)"""
         item = QTreeWidgetItem()
         item.setData(0, Qt.ItemDataRole.UserRole, full_path)
-        self.file_tree.addTopLevelItem(item)
         
         logger.debug(f"Adding resourcepack item from cache: {name}, icon_pixmap: {icon_pixmap is not None}, is_editable: {is_editable}")
         
@@ -1444,12 +1594,10 @@ class FileExplorer(QWidget):
         # 存储部件引用
         self._item_widgets[full_path] = widget
         
-        # 设置项目部件
-        self.file_tree.setItemWidget(item, 0, widget)
-        
         if is_dir:
             # 添加占位子项
             QTreeWidgetItem(item).setText(0, "...")
+        return item, widget
 
     def _on_search_changed(self, text):
         """搜索框内容变化时触发（使用防抖优化性能）"""
@@ -1653,16 +1801,8 @@ class FileExplorer(QWidget):
                         )
                         return scaled_pixmap
             elif is_dir:
-                # 不是材质包的文件夹，使用folder2.svg
-                folder_icon = load_svg_icon("svg/folder2.svg", self.dpi_scale)
-                if folder_icon:
-                    icon_size = int(64 * self.dpi_scale)
-                    scaled_pixmap = folder_icon.scaled(
-                        icon_size, icon_size,
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-                    return scaled_pixmap
+                # 不是材质包的文件夹，使用folder2.svg（缩放结果按尺寸缓存，所有文件夹共享）
+                return load_display_icon("svg/folder2.svg", 64, self.dpi_scale)
 
             return None
         except Exception:
@@ -1777,65 +1917,11 @@ class FileExplorer(QWidget):
 
     def update_font(self, font_family):
         """更新字体"""
-        escaped_font = font_family.replace("\\", "\\\\").replace("'", "\\'").replace('"', '\\"')
-        font_family_quoted = f'"{escaped_font}"'
-        
+        page_title_qss, path_label_qss, file_tree_qss = _font_qss(font_family, self.dpi_scale)
+
         # 更新页面标题字体
         if hasattr(self, 'page_title'):
-            self.page_title.setStyleSheet(f"""
-                QLabel {{
-                    color: white;
-                    background: transparent;
-                    font-size: {int(20 * self.dpi_scale)}px;
-                    font-weight: bold;
-                    font-family: {font_family_quoted};
-                }}
-            """)
-        
-        self.path_label.setStyleSheet(f"""
-            QLabel {{
-                color: rgba(255,255,255, 0.7);
-                background: transparent;
-                font-size: {int(13 * self.dpi_scale)}px;
-                font-family: {font_family_quoted};
-            }}
-        """)
-        
-        self.file_tree.setStyleSheet(f"""
-            QTreeWidget {{
-                background: rgba(0, 0, 0, 0.2);
-                border:1px solid rgba(255, 255, 255, 0.1);
-                border-radius: {int(4 * self.dpi_scale)}px;
-                color: rgba(255, 255, 255, 0.9);
-                font-family: {font_family_quoted};
-            }}
-            QTreeWidget::item {{
-                padding: {int(4 * self.dpi_scale)}px;
-            }}
-            QTreeWidget::item:hover {{
-                background: rgba(255, 255, 255, 0.1);
-            }}
-            QTreeWidget::item:selected {{
-                background: rgba(100, 150, 255, 0.3);
-                color: white;
-            }}
-            QTreeWidget::branch {{
-                background: transparent;
-            }}
-            QTreeWidget::branch:has-children:closed {{
-                image: none;
-            }}
-            QTreeWidget::branch:has-children:open {{
-                image: none;
-            }}
-            QHeaderView::section {{
-                background: rgba(255, 255, 255, 0.08);
-                color: rgba(255, 255, 255, 0.7);
-                padding: {int(6 * self.dpi_scale)}px;
-                border: none;
-                border-right: 1px solid rgba(255, 255, 255, 0.1);
-                font-size: {int(11 * self.dpi_scale)}px;
-                font-weight: bold;
-                font-family: {font_family_quoted};
-            }}
-        """)
+            self.page_title.setStyleSheet(page_title_qss)
+
+        self.path_label.setStyleSheet(path_label_qss)
+        self.file_tree.setStyleSheet(file_tree_qss)
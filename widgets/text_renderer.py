@@ -4,7 +4,7 @@
 包括本地化翻译和字体更新，确保语言切换后所有文本能够立即刷新。
 """
 
-from typing import Optional, Dict, List, Callable, Any
+from typing import Optional, Dict, Tuple, Callable, Any
 from PyQt6.QtWidgets import QWidget, QLabel, QPushButton, QLineEdit, QComboBox, QTreeWidgetItem
 from PyQt6.QtGui import QFont
 import logging
@@ -23,7 +23,8 @@ class TextRenderer:
             language_manager: 语言管理器实例
         """
         self.language_manager = language_manager
-        self._registered_widgets: Dict[str, List[Dict[str, Any]]] = {}
+        # 分组名 -> {(id(控件), 更新方法): 注册信息}，按注册顺序保存
+        self._registered_widgets: Dict[str, Dict[Tuple[int, Optional[str]], Dict[str, Any]]] = {}
         # 字体缓存
         self._font_family: str = "Microsoft YaHei UI"
         # DPI 缩放比例
@@ -60,6 +61,8 @@ class TextRenderer:
             update_method: 更新方法名，默认为 setText
             format_kwargs: 格式化参数（用于字符串格式化）
             group: 分组名称，用于批量更新
+
+        同一分组内同一控件、同一更新方法只保留一条注册，重复注册时覆盖旧的信息
         """
         widget_info = {
             "widget": widget,
@@ -69,10 +72,8 @@ class TextRenderer:
         }
 
         group_key = group if group else "default"
-        if group_key not in self._registered_widgets:
-            self._registered_widgets[group_key] = []
-
-        self._registered_widgets[group_key].append(widget_info)
+        group_widgets = self._registered_widgets.setdefault(group_key, {})
+        group_widgets[(id(widget), update_method)] = widget_info
         logger.debug(f"注册控件: {widget.__class__.__name__}, 键: {text_key}, 分组: {group_key}")
 
         # 立即更新一次文本
@@ -88,17 +89,17 @@ class TextRenderer:
         """
         if group:
             if group in self._registered_widgets:
-                self._registered_widgets[group] = [
-                    info for info in self._registered_widgets[group]
+                self._registered_widgets[group] = {
+                    key: info for key, info in self._registered_widgets[group].items()
                     if info["widget"] is not widget
-                ]
+                }
         else:
             # 在所有分组中查找并删除
             for group_key in self._registered_widgets:
-                self._registered_widgets[group_key] = [
-                    info for info in self._registered_widgets[group_key]
+                self._registered_widgets[group_key] = {
+                    key: info for key, info in self._registered_widgets[group_key].items()
                     if info["widget"] is not widget
-                ]
+                }
 
     def unregister_group(self, group: str):
         """注销整个分组"""
@@ -108,14 +109,14 @@ class TextRenderer:
     def update_language(self):
         """更新所有已注册控件的语言"""
         for group_key, widgets in self._registered_widgets.items():
-            for widget_info in widgets:
+            for widget_info in widgets.values():
                 self._update_widget(widget_info)
         logger.info(f"已更新 {sum(len(w) for w in self._registered_widgets.values())} 个控件的语言")
 
     def update_group_language(self, group: str):
         """更新指定分组的语言"""
         if group in self._registered_widgets:
-            for widget_info in self._registered_widgets[group]:
+            for widget_info in self._registered_widgets[group].values():
                 self._update_widget(widget_info)
 
     def _update_widget(self, widget_info: Dict[str, Any]):
@@ -166,7 +167,7 @@ class TextRenderer:
     def _update_all_fonts(self):
         """更新所有已注册控件的字体"""
         for group_key, widgets in self._registered_widgets.items():
-            for widget_info in widgets:
+            for widget_info in widgets.values():
                 self._update_widget_font(widget_info["widget"])
         logger.info(f"已更新 {sum(len(w) for w in self._registered_widgets.values())} 个控件的字体")
 
@@ -23,7 +23,7 @@ logger = get_logger(__name__)
 
 from styles import STYLE_BTN, STYLE_BTN_ACTIVE
 from ui import UIBuilder
-from utils import load_svg_icon, scale_icon_for_display
+from utils import load_svg_icon, preload_all_icons, scale_icon_for_display
 from widgets import NewsCard, make_transparent, set_current_font, TextRenderer
 
 
@@ -96,6 +96,8 @@ class Window(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setMouseTracking(True)
 
+        # 页面构建前集中渲染全部图标
+        preload_all_icons()
         self._init_ui()
         self._init_nav()
         self._init_content()
@@ -849,18 +851,8 @@ class Window(QWidget):
         self.config["background_mode"] = mode
         self.config_manager.save_config()
 
-        # 样式表常量
-        bg_card_selected = "QPushButton{background:rgba(255,255,255,0.15);border:none;border-radius:0px;}QPushButton:hover{background:rgba(255,255,255,0.1);}QPushButton:pressed{background:rgba(255,255,255,0.05);}"
-        bg_card_unselected = "QPushButton{background:rgba(255,255,255,0.05);border:none;border-radius:0px;}QPushButton:hover{background:rgba(255,255,255,0.1);}QPushButton:pressed{background:rgba(255,255,255,0.03);}"
-
         def set_card_selected(card, selected):
-            card.setStyleSheet(bg_card_selected if selected else bg_card_unselected)
-            if selected:
-                check_pixmap = load_svg_icon("svg/check-lg.svg", self.dpi_scale)
-                if check_pixmap:
-                    card.check_label.setPixmap(scale_icon_for_display(check_pixmap, 20, self.dpi_scale))
-            else:
-                card.check_label.clear()
+            self.ui_builder.settings_page_builder.set_card_selected(card, selected)
 
         if mode == "solid":
             # 合并后的纯色背景（包括原来的黑色背景）
@@ -873,9 +865,9 @@ class Window(QWidget):
             # 显示不透明度滑块
             if hasattr(self, 'opacity_widget'):
                 self.opacity_widget.setVisible(True)
-            # 显示模糊开关
-            if hasattr(self, 'blur_toggle_widget'):
-                self.blur_toggle_widget.setVisible(True)
+            # 显示模糊开关（首次切换到纯色背景时才构建）
+            self.ui_builder.settings_page_builder.ensure_blur_toggle_option()
+            self.blur_toggle_widget.setVisible(True)
             # 使用 RGB 颜色 + 不透明度
             color = self.config.get("background_color", "#000000")
             opacity_value = self.config.get("blur_opacity", 150)
@@ -1189,16 +1181,7 @@ class Window(QWidget):
         ]
 
         for card, card_mode in cards:
-            if card_mode == mode:
-                card.setStyleSheet(
-                    "QPushButton{background:rgba(255,255,255,0.15);border:none;border-radius:0px;}QPushButton:hover{background:rgba(255,255,255,0.1);}QPushButton:pressed{background:rgba(255,255,255,0.05);}")
-                check_pixmap = load_svg_icon("svg/check-lg.svg", self.dpi_scale)
-                if check_pixmap:
-                    card.check_label.setPixmap(scale_icon_for_display(check_pixmap, 20, self.dpi_scale))
-            else:
-                card.setStyleSheet(
-                    "QPushButton{background:rgba(255,255,255,0.05);border:none;border-radius:0px;}QPushButton:hover{background:rgba(255,255,255,0.1);}QPushButton:pressed{background:rgba(255,255,255,0.03);}")
-                card.check_label.clear()
+            self.ui_builder.settings_page_builder.set_card_selected(card, card_mode == mode)
 
     def on_font_family_changed(self, font_family):
         """字体选择变化"""